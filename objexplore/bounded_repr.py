@@ -0,0 +1,106 @@
+from concurrent.futures import TimeoutError
+from itertools import islice
+import reprlib
+import time
+from typing import Any
+
+from .config import repr_time_budget
+from .worker import run_in_own_thread
+
+# Subclasses of these, e.g. `defaultdict` or `Counter`, are cut short like the builtin types
+BOUNDED_BASE_TYPES = (dict, list, tuple, set, frozenset)
+
+
+def fallback_repr(obj: Any) -> str:
+    return f"<{type(obj).__name__} object at {id(obj):#x}>"
+
+
+class BoundedRepr(reprlib.Repr):
+    """A repr that is only as long as it needs to be for a line of the terminal, for titles and
+    labels. Containers, strings and bytes are only looked at up to the size limits, so the repr of a
+    list with millions of items or a huge blob costs the same as a small one. The whole repr has a
+    wall clock budget, and objects with a `__repr__` of their own (which could be slow, e.g. a
+    proxy that hits a database) are repr'd on a thread of their own and given up on once the
+    budget runs out"""
+
+    def __init__(self):
+        super().__init__()
+        self.maxlevel = 3
+        self.maxtuple = self.maxlist = self.maxarray = 50
+        self.maxdict = self.maxset = self.maxfrozenset = self.maxdeque = 50
+        self.maxstring = self.maxlong = self.maxother = 1000
+        self.deadline = 0.0
+
+    def __call__(self, obj: Any) -> str:
+        self.deadline = time.perf_counter() + repr_time_budget
+        return self.repr(obj)
+
+    def repr1(self, x: Any, level: int) -> str:
+        if time.perf_counter() > self.deadline:
+            return "..."
+        return super().repr1(x, level)
+
+    def repr_bytes(self, x: bytes, level: int) -> str:
+        if len(x) <= self.maxstring:
+            return repr(x)
+        return repr(x[: self.maxstring]) + "..."
+
+    repr_bytearray = repr_bytes
+
+    # reprlib sorts dicts and sets before cutting them short, which costs more than the whole repr of
+    # a huge one. These show the first items in the order they come in, like the builtin repr
+
+    def repr_dict(self, x: dict, level: int) -> str:
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{" + self.fillvalue + "}"
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append(self.fillvalue)
+        return "{" + ", ".join(pieces) + "}"
+
+    def repr_set(self, x: set, level: int) -> str:
+        if not x:
+            return "set()"
+        return "{" + self.repr_items(x, level, self.maxset) + "}"
+
+    def repr_frozenset(self, x: frozenset, level: int) -> str:
+        if not x:
+            return "frozenset()"
+        return "frozenset({" + self.repr_items(x, level, self.maxfrozenset) + "})"
+
+    def repr_items(self, x: Any, level: int, maxiter: int) -> str:
+        if level <= 0:
+            return self.fillvalue
+        pieces = [self.repr1(item, level - 1) for item in islice(x, maxiter)]
+        if len(x) > maxiter:
+            pieces.append(self.fillvalue)
+        return ", ".join(pieces)
+
+    def repr_int(self, x: int, level: int) -> str:
+        # Turning a huge int into decimal is slow, and not allowed at all past 4300 digits
+        if x.bit_length() > 3 * self.maxlong:
+            return f"<int of {x.bit_length()} bits>"
+        return super().repr_int(x, level)
+
+    def repr_instance(self, x: Any, level: int) -> str:
+        cls = type(x)
+        if cls.__repr__ is object.__repr__ or cls.__module__ == "builtins":
+            return super().repr_instance(x, level)
+        for base in BOUNDED_BASE_TYPES:
+            if isinstance(x, base):
+                return f"{cls.__name__}({getattr(self, 'repr_' + base.__name__)(x, level)})"
+
+        # A repr that never returns keeps its thread, but nothing else is waiting on it
+        future = run_in_own_thread(super().repr_instance, x, level, name="objexplore-repr")
+        try:
+            return future.result(timeout=max(self.deadline - time.perf_counter(), 0))
+        except TimeoutError:
+            return fallback_repr(x)
+
+
+bounded_repr = BoundedRepr()
@@ -1,21 +1,66 @@
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_left
+from concurrent.futures import Future, wait
+from dataclasses import dataclass, field
+from functools import partial
 import importlib
 import inspect
+import io
+from itertools import compress, islice
 import pkgutil
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import threading
+import time
+from types import GeneratorType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from rich.console import Console
+from rich.containers import Lines
 from rich.highlighter import ReprHighlighter
-from rich.pretty import Pretty
 from rich.style import Style
 from rich.syntax import Syntax
 from rich.text import Text
 
-from .utils import is_empty
+from .bounded_repr import bounded_repr
+from .config import (
+    attribute_hang_time,
+    attribute_time_budget,
+    background_time_slice,
+    cheap_len_time,
+)
+from .introspection import (
+    Introspection,
+    TypeFacts,
+    attrs_stamp,
+    get_type_facts,
+    introspection_cache,
+    stored_attrs,
+)
+from .persistent_cache import cached_on_disk
+from .search import SearchIndex, fuzzy_score
+from .source_index import find_source
+from .utils import is_empty, lazy_property
+from .worker import run_in_own_thread
 
 highlighter = ReprHighlighter()
 
 
+# How many children are filtered before checking if the filter pass has used up its time
+FILTER_CHUNK_SIZE = 256
+
+# `dict.keys()`, `dict.values()` and `dict.items()`, peeking at them doesn't use anything up
+DICT_VIEW_TYPES: Tuple[type, ...] = (type({}.keys()), type({}.values()), type({}.items()))
+
 PUBLIC = "PUBLIC"
 PRIVATE = "PRIVATE"
 
@@ -29,6 +74,115 @@ def safegetattr(obj, attr):
         return None
 
 
+class TypeFlag:
+    """Bit flags for the kinds of objects the filters can select. Every child of an explored object
+    is classified once, so the enabled filters can be combined into a single mask"""
+
+    (
+        CLASS,
+        FUNCTION,
+        METHOD,
+        MODULE,
+        BUILTIN,
+        INT,
+        STR,
+        FLOAT,
+        BOOL,
+        DICT,
+        LIST,
+        TUPLE,
+        SET,
+    ) = (1 << i for i in range(13))
+
+
+class UnimportedModule:
+    """Placeholder for a submodule that has not been imported yet. Modules often have submodules
+    that are not referenced from a call to `dir()`, and importing every one of them just to list
+    them is slow for big packages, so they are only imported when selected, see `ChildRow.resolve`"""
+
+    def __init__(self, name: str, ispkg: bool):
+        self.name = name
+        self.ispkg = ispkg
+        # The exception raised if importing the module failed
+        self.error: Optional[Exception] = None
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"<module '{self.name}' (failed to import: {self.error!r})>"
+        return f"<module '{self.name}' (not imported)>"
+
+
+class UnevaluatedAttribute:
+    """Placeholder for an attribute that runs code when it is read, e.g. a property, which could
+    be slow (network or disk I/O, building a large structure, ...). It is only read once the row is
+    selected, on a thread of its own so it can't hang the explorer, see `ChildRow.evaluate`"""
+
+    def __init__(self, owner: Any, name: str, error: Optional[BaseException] = None):
+        self.owner = owner
+        self.name = name
+        # Reading the attribute on a thread of its own, once it has started
+        self.future: Optional[Future] = None
+        self.started = 0.0
+        # The exception raised by reading the attribute, if it failed
+        self.error = error
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"<attribute '{self.name}' (failed: {self.error!r})>"
+        return f"<attribute '{self.name}' (not evaluated yet)>"
+
+
+def placeholder_failed(obj: Any) -> bool:
+    """ Whether `obj` is the placeholder of a submodule or attribute that failed to load """
+    return (
+        type(obj) in (UnimportedModule, UnevaluatedAttribute) and obj.error is not None
+    )
+
+
+# Objects of these exact types can't be any of the other kinds
+exact_type_flags = {
+    int: TypeFlag.INT,
+    str: TypeFlag.STR,
+    float: TypeFlag.FLOAT,
+    bool: TypeFlag.BOOL,
+    dict: TypeFlag.DICT,
+    list: TypeFlag.LIST,
+    tuple: TypeFlag.TUPLE,
+    set: TypeFlag.SET,
+    UnimportedModule: TypeFlag.MODULE,
+    UnevaluatedAttribute: 0,
+}
+
+
+# The `TypeFlag`s of every type classified so far. Each check in `classify` only depends on the
+# type of the object, unless the object lies about its `__class__`
+type_flags: Dict[type, int] = dict(exact_type_flags)
+
+
+def classify(obj: Any) -> int:
+    """ Return the `TypeFlag`s that apply to the given object """
+    cls = type(obj)
+    flags = type_flags.get(cls)
+    if flags is not None:
+        return flags
+
+    flags = 0
+    if inspect.isclass(obj):
+        flags |= TypeFlag.CLASS
+    if inspect.isfunction(obj):
+        flags |= TypeFlag.FUNCTION
+    if inspect.ismethod(obj):
+        flags |= TypeFlag.METHOD
+    if inspect.ismodule(obj):
+        flags |= TypeFlag.MODULE
+    if inspect.isbuiltin(obj):
+        flags |= TypeFlag.BUILTIN
+
+    if getattr(obj, "__class__", None) is cls:
+        type_flags[cls] = flags
+    return flags
+
+
 class CachedObject:
     """Internal representation of every object that is being inspected/explored by objexplore
 
@@ -44,102 +198,252 @@ class CachedObject:
         index: Any = None,
         hidden: bool = False,
     ):
+        if obj is not None and attr_name is None and index is None:
+            raise ValueError("Need to specify an attribute name or an index")
+
         self.obj = obj
+        self.parent_path = parent_path
+        self.index = index
+        self.hidden = hidden
+        self._attr_name = attr_name
         self.is_callable = callable(obj)
-        self.attr_name = attr_name if attr_name else repr(self.obj)
 
+        # Set once `cache()` has run, the lock stops a prefetch and the explorer caching at the same time
+        self.is_cached = False
+        self.cache_lock = threading.Lock()
+        self.public_attributes: Dict[str, ChildRow] = {}
+        self.private_attributes: Dict[str, ChildRow] = {}
+        self.filtered_public_attributes: Dict[str, ChildRow] = {}
+        self.filtered_private_attributes: Dict[str, ChildRow] = {}
+        # The keys of the filtered attributes in order, so the explorer can index into them
+        self.filtered_public_keys: List[str] = []
+        self.filtered_private_keys: List[str] = []
+
+        flags = classify(self.obj)
+        self.isbuiltin = bool(flags & TypeFlag.BUILTIN)
+        self.isclass = bool(flags & TypeFlag.CLASS)
+        self.isfunction = bool(flags & TypeFlag.FUNCTION)
+        self.ismethod = bool(flags & TypeFlag.METHOD)
+        # Also True for submodules that have not been imported yet, see `UnimportedModule`
+        self.ismodule = bool(flags & TypeFlag.MODULE)
+
+        # The `TypeFlag`s of the enabled filters, if 0 no filters are enabled
+        self.filter_mask: int = 0
+        self.fuzzy_search: bool = False
+        self.search_filter: str = ""
+        # The filter pass that is still running, if any
+        self.pending_filter: Optional[Iterator[None]] = None
+        # The results of the current search and of each search that led up to it
+        self.search_stack: List[SearchMatches] = []
+
+    # Everything below is computed the first time it is needed. A CachedObject is created for
+    # every attribute of the object being explored, so doing this work up front means running
+    # `repr()`, `inspect.getsource()`, etc on thousands of objects that are never looked at
+
+    @lazy_property
+    def attr_name(self) -> str:
+        return self._attr_name if self._attr_name else bounded_repr(self.obj)
+
+    @lazy_property
+    def dotpath(self) -> Text:
         if self.obj is None:
             # TODO this doesn't seem like the right choice but removing it causes a crash. Investigate!
-            self.dotpath = highlighter("None")
+            return highlighter("None")
 
-        elif attr_name is not None:
-            if not parent_path:
-                self.dotpath = Text(attr_name, style=Style(color="cyan"))
-            else:
-                self.dotpath = (
-                    parent_path
-                    + Text(".", style=Style(color="white"))
-                    + Text(attr_name, style=Style(color="cyan"))
-                )
+        elif self._attr_name is not None:
+            if not self.parent_path:
+                return Text(self._attr_name, style=Style(color="cyan"))
+            return (
+                self.parent_path
+                + Text(".", style=Style(color="white"))
+                + Text(self._attr_name, style=Style(color="cyan"))
+            )
 
-        elif index is not None:
-            if type(index) == str:
-                repr_index = console.render_str(f'"{index}"')
+        else:
+            if type(self.index) == str:
+                repr_index = console.render_str(f'"{self.index}"')
             else:
-                repr_index = console.render_str(str(index))
-            if not parent_path:
-                self.dotpath = (
+                repr_index = console.render_str(str(self.index))
+            if not self.parent_path:
+                return (
                     Text("[", style=Style(color="white"))
                     + repr_index
                     + Text("]", style=Style(color="white"))
                 )
-            else:
-                self.dotpath = (
-                    parent_path
-                    + Text("[", style=Style(color="white"))
-                    + repr_index
-                    + Text("]", style=Style(color="white"))
-                )
-        else:
-            raise ValueError("Need to specify an attribute name or an index")
+            return (
+                self.parent_path
+                + Text("[", style=Style(color="white"))
+                + repr_index
+                + Text("]", style=Style(color="white"))
+            )
+
+    # The attributes, source and docstring don't depend on the path the object was reached by, so
+    # they are shared with every other CachedObject of the same object, see `introspection_cache`.
+    # Most of them are even shared by every instance of the same type, see `TypeFacts`
+
+    @lazy_property
+    def introspection(self) -> Introspection:
+        return introspection_cache.lookup(self.obj)
 
-        self.plain_attrs = dir(self.obj)
+    @lazy_property
+    def type_facts(self) -> TypeFacts:
+        return get_type_facts(type(self.obj))
 
-        if "__weakref__" in self.plain_attrs:
-            # Ignore weakrefs
-            # Why??? I don't remember
-            self.plain_attrs.remove("__weakref__")
+    @lazy_property
+    def attrs_stamp(self) -> Optional[int]:
+        return attrs_stamp(self.obj)
 
-        self.plain_public_attributes = sorted(
-            attr for attr in self.plain_attrs if not attr.startswith("_")
+    @lazy_property
+    def plain_attrs(self) -> List[str]:
+        if self.type_facts.plain_instances:
+            return self.type_facts.instance_attrs(self.obj)
+        return self.introspection.get(
+            "plain_attrs",
+            partial(stored_attrs, self.obj, self.attrs_stamp),
+            stamp=self.attrs_stamp,
         )
-        self.plain_private_attributes = sorted(
-            attr for attr in self.plain_attrs if attr.startswith("_")
+
+    @lazy_property
+    def plain_public_attributes(self) -> List[str]:
+        return self.introspection.get(
+            "plain_public_attributes",
+            lambda: sorted(attr for attr in self.plain_attrs if not attr.startswith("_")),
+            stamp=self.attrs_stamp,
         )
 
-        self.public_attributes: Dict[str, CachedObject] = {}
-        self.private_attributes: Dict[str, CachedObject] = {}
-        self.filtered_public_attributes: Dict[str, CachedObject] = {}
-        self.filtered_private_attributes: Dict[str, CachedObject] = {}
+    @lazy_property
+    def plain_private_attributes(self) -> List[str]:
+        return self.introspection.get(
+            "plain_private_attributes",
+            lambda: sorted(attr for attr in self.plain_attrs if attr.startswith("_")),
+            stamp=self.attrs_stamp,
+        )
 
+    def read_source(self) -> str:
+        source = find_source(self.obj)
+        if source is not None:
+            return source
         try:
-            self._source = inspect.getsource(self.obj)  # type: ignore
+            return inspect.getsource(self.obj)  # type: ignore
         except Exception:
-            self._source = ""
+            return ""
 
-        self.length: Optional[int]
+    @lazy_property
+    def _source(self) -> str:
+        if (
+            self.type_facts.plain_instances
+            and not self.type_facts.sourceable
+            and "__wrapped__" not in self.instance_dict
+        ):
+            # `inspect.getsource()` would only raise a TypeError
+            return ""
+        return self.introspection.get("source", self.read_source)
 
+    @lazy_property
+    def instance_dict(self) -> Dict[str, Any]:
         try:
-            self.length = len(self.obj)  # type: ignore
+            return vars(self.obj)
+        except TypeError:
+            return {}
+
+    @lazy_property
+    def length(self) -> Optional[int]:
+        """`len()` of the object, None if it has no length or if `len()` could be slow and has not
+        been asked for yet, see `TypeFacts.len_is_cheap` and `measure_length`"""
+        if not self.type_facts.len_is_cheap:
+            return None
+        try:
+            return len(self.obj)  # type: ignore
         except TypeError:
-            self.length = None
+            return None
 
-        self.isbuiltin: bool = inspect.isbuiltin(self.obj)
-        self.isclass: bool = inspect.isclass(self.obj)
-        self.isfunction: bool = inspect.isfunction(self.obj)
-        self.ismethod: bool = inspect.ismethod(self.obj)
-        self.ismethoddescriptor: bool = inspect.ismethoddescriptor(self.obj)
-        self.ismodule: bool = inspect.ismodule(self.obj)
+    @property
+    def length_unknown(self) -> bool:
+        """ Whether the object has a length that has not been computed because it could be slow """
+        return self.length is None and not self.type_facts.len_is_cheap
 
-        self.filters: List[Union[bool, Callable[[Any], Any]]] = []
-        self.search_filter: str = ""
+    def measure_length(self):
+        """Compute the length of the object even if it could be slow. If it turns out to be fast, the
+        length of every other instance of the type is computed without asking"""
+        start = time.perf_counter()
+        try:
+            self.length = len(self.obj)  # type: ignore
+        except Exception:
+            return
+        if time.perf_counter() - start < cheap_len_time:
+            self.type_facts.len_is_cheap = True
+
+    # Highlighted attributes
+
+    @lazy_property
+    def typeof(self) -> Text:
+        return self.type_facts.typeof
+
+    @lazy_property
+    def ismethoddescriptor(self) -> bool:
+        return self.type_facts.ismethoddescriptor
+
+    @lazy_property
+    def docstring(self) -> Text:
+        if (
+            self.type_facts.docstring is not None
+            and "__doc__" not in self.instance_dict
+        ):
+            return self.type_facts.docstring
+        return self.introspection.get(
+            "docstring",
+            lambda: console.render_str(
+                cached_on_disk(self.obj, "doc", partial(inspect.getdoc, self.obj))
+                or "None"
+            ),
+        )
+
+    @lazy_property
+    def docstring_lines(self) -> Lines:
+        return self.introspection.get("docstring_lines", self.docstring.split)
+
+    @lazy_property
+    def repr(self) -> Text:
+        """ The first line of a repr that is cut short for huge or slow objects, see `BoundedRepr` """
+        _repr = highlighter(bounded_repr(self.obj))
+        if "\n" in _repr:
+            _repr = _repr.split("\n")[0]
+        _repr.overflow = "ellipsis"
+        return _repr
 
-        # Highlighted attributes
-        self.typeof: Text = highlighter(str(type(self.obj)))
-        self.docstring: Text = console.render_str(inspect.getdoc(self.obj) or "None")
-        self.docstring_lines = self.docstring.split()
-        self.repr = highlighter(repr(self.obj))
-        if "\n" in self.repr:
-            self.repr = self.repr.split("\n")[0]
-        self.repr.overflow = "ellipsis"
-        self.pretty = Pretty(self.obj)
+    @lazy_property
+    def filtered_dict(self) -> "DictView":
+        return DictView(self)
+
+    @lazy_property
+    def filtered_list(self) -> "ListView":
+        return ListView(self)
+
+    @lazy_property
+    def peekable(self) -> bool:
+        """Whether the items of the object can be peeked at with an `IteratorView`. Files and other
+        streams are iterators too, but reading from them could block"""
+        cls = type(self.obj)
+        if cls in DICT_VIEW_TYPES or isinstance(self.obj, GeneratorType):
+            return True
+        return (
+            hasattr(cls, "__next__")
+            and hasattr(cls, "__iter__")
+            and not isinstance(self.obj, io.IOBase)
+        )
 
-        self.text = Text(self.attr_name, style=Style(), overflow="ellipsis")
+    @lazy_property
+    def peeked_items(self) -> "IteratorView":
+        return IteratorView(self)
+
+    @lazy_property
+    def text(self) -> Text:
+        text = Text(self.attr_name, style=Style(), overflow="ellipsis")
 
         if self.ismodule:
-            self.text.style = Style(color="blue")
+            text.style = Style(color="blue")
         elif self.isclass:
-            self.text.style = Style(color="magenta")
+            text.style = Style(color="magenta")
         elif (
             self.isfunction
             or self.ismethod
@@ -147,42 +451,47 @@ class CachedObject:
             # builtin_function_or_method type. Don't know where this is defined
             or isinstance(self.obj, type("".capitalize))
         ):
-            self.text.style = Style(color="cyan", italic=True)
-            self.text += Text("()", style=Style(color="white"))
+            text.style = Style(color="cyan", italic=True)
+            text += Text("()", style=Style(color="white"))
         elif type(self.obj) == dict:
-            self.text.style = Style(color="light_sea_green")
-            self.text = (
+            text.style = Style(color="light_sea_green")
+            text = (
                 Text("{**", style=Style(color="white"))
-                + self.text
+                + text
                 + Text("}", style=Style(color="white"))
             )
         elif type(self.obj) == list:
-            self.text.style = Style(color="indian_red1")
-            self.text = (
+            text.style = Style(color="indian_red1")
+            text = (
                 Text("[*", style=Style(color="white"))
-                + self.text
+                + text
                 + Text("]", style=Style(color="white"))
             )
         elif type(self.obj) == tuple:
-            self.text.style = Style(color="pale_violet_red1")
-            self.text = (
+            text.style = Style(color="pale_violet_red1")
+            text = (
                 Text("(*", style=Style(color="white"))
-                + self.text
+                + text
                 + Text(")", style=Style(color="white"))
             )
         elif type(self.obj) == set:
-            self.text.style = Style(color="light_goldenrod3")
-            self.text = (
+            text.style = Style(color="light_goldenrod3")
+            text = (
                 Text("{*", style=Style(color="white"))
-                + self.text
+                + text
                 + Text("}", style=Style(color="white"))
             )
 
         if not is_empty(self.obj):
-            self.text.style += Style(dim=True, strike=True)  # type: ignore
+            text.style += Style(dim=True, strike=True)  # type: ignore
+
+        if self.hidden:
+            text.style += Style(dim=True)  # type: ignore
 
-        if hidden:
-            self.text.style += Style(dim=True)  # type: ignore
+        if type(self.obj) == UnevaluatedAttribute:
+            text += Text(" …", style=Style(dim=True))
+
+        return text
 
     @property
     def title(self):
@@ -194,159 +503,261 @@ class CachedObject:
         title.truncate(console.width - 4)
         return title
 
-    def cache(self):
-        """ Cache any attributes that are useful to this object for easy access later """
+    def cache(self, cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """Cache any attributes that are useful to this object for easy access later
+
+        Only a lightweight `ChildRow` is stored for each attribute, the full `CachedObject` is built
+        when the row is drawn or selected in the explorer
 
-        if not self.public_attributes:
+        This can run on a background thread to prefetch the attributes before the object is explored,
+        see `prefetch.Prefetcher`. Nothing is stored until everything has been cached, and if
+        `cancelled` returns True partway through, the work is thrown away and False is returned
+        """
+        with self.cache_lock:
+            if self.is_cached:
+                return True
+
+            public_attributes: Dict[str, ChildRow] = {}
             for attr in self.plain_public_attributes:
-                self.public_attributes[attr] = CachedObject(
-                    safegetattr(self.obj, attr),
-                    parent_path=self.dotpath,
-                    attr_name=attr,
-                )
+                if cancelled and cancelled():
+                    return False
+                public_attributes[attr] = self.child_row(attr)
 
-        if not self.private_attributes:
+            private_attributes: Dict[str, ChildRow] = {}
             for attr in self.plain_private_attributes:
-                self.private_attributes[attr] = CachedObject(
-                    safegetattr(self.obj, attr),
-                    parent_path=self.dotpath,
-                    attr_name=attr,
-                )
+                if cancelled and cancelled():
+                    return False
+                private_attributes[attr] = self.child_row(attr)
 
-        # Sometimes a module will have submodules that are not referenced from a call to `dir()`
-        # This check will look through all submodules that are not referenced by `dir()` and add
-        # them to the cached attributes
-        if self.ismodule:
-            prefix = safegetattr(self.obj, "__name__") + "."
-            path = safegetattr(self.obj, "__path__")
-            for importer, full_module_name, ispkg in pkgutil.iter_modules(path, prefix):
-                name = full_module_name.rsplit(".")[-1]
-                if name in self.public_attributes or name in self.private_attributes:
-                    # Skip over submodules that have already been indexed
-                    continue
-
-                try:
-                    # If we have not encountered this module, try to import it
-                    module = importlib.import_module(full_module_name)
-                except Exception:
-                    continue
-
-                if not name.startswith("_"):
-                    self.public_attributes[name] = CachedObject(
-                        module, parent_path=self.dotpath, attr_name=name, hidden=True
-                    )
-                else:
-                    self.private_attributes[name] = CachedObject(
-                        module, parent_path=self.dotpath, attr_name=name, hidden=True
+            # Sometimes a module will have submodules that are not referenced from a call to `dir()`
+            # This check will look through all submodules that are not referenced by `dir()` and add
+            # them to the cached attributes. They are not imported here, see `UnimportedModule`.
+            # Only packages have a `__path__`, `iter_modules(None)` would list every top level module
+            path = safegetattr(self.obj, "__path__") if self.ismodule else None
+            if path is not None:
+                prefix = safegetattr(self.obj, "__name__") + "."
+                for importer, full_module_name, ispkg in pkgutil.iter_modules(path, prefix):
+                    if cancelled and cancelled():
+                        return False
+
+                    name = full_module_name.rsplit(".")[-1]
+                    if name in public_attributes or name in private_attributes:
+                        # Skip over submodules that have already been indexed
+                        continue
+
+                    row = ChildRow(
+                        name=name,
+                        obj=UnimportedModule(full_module_name, ispkg),
+                        parent_path=self.dotpath,
+                        hidden=True,
                     )
+                    if not name.startswith("_"):
+                        public_attributes[name] = row
+                    else:
+                        private_attributes[name] = row
+
+            self.public_attributes = public_attributes
+            self.private_attributes = private_attributes
+            self.num_public_attributes: int = len(self.public_attributes)
+            self.num_private_attributes: int = len(self.private_attributes)
+
+            self.filter()
+            self.is_cached = True
+            return True
 
-        self.num_public_attributes: int = len(self.public_attributes)
-        self.num_private_attributes: int = len(self.private_attributes)
+    def child_row(self, attr: str) -> "ChildRow":
+        if self.attr_runs_code(attr):
+            obj: Any = UnevaluatedAttribute(self.obj, attr)
+        else:
+            obj = safegetattr(self.obj, attr)
+        return ChildRow(name=attr, obj=obj, parent_path=self.dotpath)
 
-        self.filter()
+    def attr_runs_code(self, attr: str) -> bool:
+        """Whether reading the attribute could be slow, see `TypeFacts.attr_runs_code`. A module is
+        read like any other instance, attributes of a class are looked up differently, see
+        `TypeFacts.attr_of_class_runs_code`"""
+        if self.isclass:
+            return get_type_facts(self.obj).attr_of_class_runs_code(attr)
+        return self.type_facts.attr_runs_code(attr, self.instance_dict)
 
     def set_filters(
-        self, filters: List[Union[bool, Callable[[Any], Any]]], search_filter: str = ""
+        self, filter_mask: int, search_filter: str = "", fuzzy_search: bool = False
     ):
-        """ Reset the filters associated with this object, and rerun the filtering process again with the new filters """
-        self.filters = filters
-        self.search_filter = search_filter.lower()
-        self.filter()
+        """Reset the filters associated with this object, and rerun the filtering process again with the new filters
+
+        If only the search filter changed we don't need to look at every attribute again. When a
+        character is typed, the new matches are a subset of the matches of the previous search,
+        and when a character is deleted, the matches of that search are still on the search stack
+
+        The filtering is started here but may not be finished when this returns, see `run_pending_filter`
+
+        With `fuzzy_search` the search matches names that contain the characters of the search in
+        order, and the matches are sorted by how well they match, see `search.fuzzy_score`
+        """
+        search_filter = search_filter.lower()
+
+        if (
+            filter_mask != self.filter_mask
+            or fuzzy_search != self.fuzzy_search
+            or not self.search_stack
+        ):
+            self.filter_mask = filter_mask
+            self.fuzzy_search = fuzzy_search
+            self.search_filter = search_filter
+            self.search_stack = []
+            self.start_filter()
+            return
+
+        # Throw away the results of any search that is not contained in the new search
+        while self.search_stack and self.search_stack[-1].search_filter not in search_filter:
+            self.search_stack.pop()
+
+        self.search_filter = search_filter
+        if not self.search_stack:
+            self.start_filter()
+        elif self.search_stack[-1].search_filter == search_filter:
+            self.pending_filter = None
+            self.restore_search(self.search_stack[-1])
+        else:
+            self.start_filter(matches=self.search_stack[-1])
+
+    def start_filter(self, matches: Optional["SearchMatches"] = None):
+        """ Replace any filter pass that is still running with a new one and run the first part of it """
+        self.pending_filter = self.filter_steps(matches)
+        self.run_pending_filter(background_time_slice)
+
+    def run_pending_filter(self, time_budget: float) -> bool:
+        """Continue the current filter pass for up to `time_budget` seconds.
+        Return True if there is nothing left to filter"""
+        if self.pending_filter is None:
+            return True
+
+        deadline = time.perf_counter() + time_budget
+        for _ in self.pending_filter:
+            if time.perf_counter() > deadline:
+                return False
+
+        self.pending_filter = None
+        return True
 
     def filter(self):
         """ Run the filters on all of this objects attributes """
+        self.pending_filter = None
+        self.search_stack = []
+        for _ in self.filter_steps():
+            pass
+
+    def filter_steps(self, matches: Optional["SearchMatches"] = None) -> Iterator[None]:
+        """Run the filters on this objects attributes, yielding after every `FILTER_CHUNK_SIZE` children so
+        the work can be spread out between keystrokes. The filtered attributes are filled in as it goes so
+        the results so far can be drawn. If `matches` is given only those are narrowed down with the search
+        filter, they have already passed the other filters"""
+        filter_mask = self.filter_mask if matches is None else 0
+
         self.filtered_public_attributes = {}
-        for attr, cached_obj in self.public_attributes.items():
-            if self.search_filter not in attr.lower():
-                continue
-            if not self.filters:
-                self.filtered_public_attributes[attr] = cached_obj
-            else:
-                # Only keep objects that match the filter
-                for _filter in self.filters:
-                    if _filter(cached_obj):
-                        self.filtered_public_attributes[attr] = cached_obj
-                        break
-        self.num_filtered_public_attributes = len(self.filtered_public_attributes)
+        self.filtered_public_keys = []
+        yield from self.filter_attributes(
+            self.public_attributes if matches is None else matches.public_attributes,
+            self.filtered_public_attributes,
+            self.filtered_public_keys,
+            filter_mask,
+        )
 
         self.filtered_private_attributes = {}
-        for attr, cached_obj in self.private_attributes.items():
-            if self.search_filter not in attr.lower():
-                continue
-            if not self.filters:
-                self.filtered_private_attributes[attr] = cached_obj
+        self.filtered_private_keys = []
+        yield from self.filter_attributes(
+            self.private_attributes if matches is None else matches.private_attributes,
+            self.filtered_private_attributes,
+            self.filtered_private_keys,
+            filter_mask,
+        )
+
+        if matches is None:
+            yield from self.filtered_dict.filter_steps(
+                self.filter_mask, self.search_filter, fuzzy_search=self.fuzzy_search
+            )
+        else:
+            yield from self.filtered_dict.filter_steps(
+                0,
+                self.search_filter,
+                positions=matches.dict_positions,
+                fuzzy_search=self.fuzzy_search,
+            )
+
+        self.search_stack.append(self.current_search_matches())
+
+        # List items are not affected by the search
+        if matches is not None:
+            return
+
+        yield from self.filtered_list.filter_steps(self.filter_mask)
+
+    def filter_attributes(
+        self,
+        attributes: Dict[str, "ChildRow"],
+        filtered_attributes: Dict[str, "ChildRow"],
+        filtered_keys: List[str],
+        filter_mask: int,
+    ) -> Iterator[None]:
+        """ Add the attributes that pass the filters to `filtered_attributes` and `filtered_keys` """
+        scores: Dict[str, int] = {}
+        for count, (attr, row) in enumerate(attributes.items(), 1):
+            # Only keep objects that match the filter
+            if filter_mask and not row.flags & filter_mask:
+                pass
+
+            elif not self.fuzzy_search:
+                if self.search_filter in row.lowered_name:
+                    filtered_attributes[attr] = row
+                    filtered_keys.append(attr)
+
             else:
-                # Only keep objects that match the filter
-                for _filter in self.filters:
-                    if _filter(cached_obj):
-                        self.filtered_private_attributes[attr] = cached_obj
-                        break
-        self.num_filtered_private_attributes = len(self.filtered_private_attributes)
-
-        self.filtered_dict: Dict[str, FilteredDictKey] = {}
-        if type(self.obj) == dict:
-            for key, val in self.obj.items():
-                repr_key: Text
-                repr_val: Text
-
-                if type(key) == str:
-                    repr_key = console.render_str(f'"{key}"')
-                elif type(key) in (int, float, dict, list, set, tuple, bool, None):
-                    repr_key = console.render_str(str(key))
-                else:
-                    repr_key = highlighter(str(key))
-
-                repr_val = highlighter(str(type(val)))
-
-                if not is_empty(val):
-                    repr_val.style += " dim"
-                    repr_val.style = repr_val.style.strip()
-
-                line = Text(" ") + repr_key + Text(": ") + repr_val
-                line.overflow = "ellipsis"
-
-                cached_obj = CachedObject(val, parent_path=self.dotpath, index=key)
-
-                if type(key) == str and self.search_filter not in key.lower():
-                    continue
-                if self.filters:
-                    for _filter in self.filters:
-                        if _filter(cached_obj):
-                            self.filtered_dict[key] = FilteredDictKey(
-                                text=line, cached_object=cached_obj
-                            )
-                            break
-                else:
-                    self.filtered_dict[key] = FilteredDictKey(
-                        text=line, cached_object=cached_obj
-                    )
+                score = fuzzy_score(self.search_filter, row.lowered_name)
+                if score is not None:
+                    filtered_attributes[attr] = row
+                    filtered_keys.append(attr)
+                    scores[attr] = score
 
-        self.num_filtered_dict_keys = len(self.filtered_dict)
+            if count % FILTER_CHUNK_SIZE == 0:
+                yield
 
-        self.filtered_list: List[Tuple[Text, CachedObject]] = []
-        if isinstance(self.obj, (list, tuple, set)):
-            for index, item in enumerate(self.obj):
-                line = (
-                    Text(" [", style=Style(color="white"))
-                    + Text(str(index), style=Style(color="blue"))
-                    + Text("] ", style=Style(color="white"))
-                    + highlighter(str(type(item)))
-                )
-                if not is_empty(item):
-                    line.style += Style(dim=True)
+        if scores:
+            # Best matches first
+            filtered_keys.sort(key=lambda attr: -scores[attr])
 
-                self.filtered_list.append(
-                    (line, CachedObject(item, parent_path=self.dotpath, index=index))
-                )
-            if self.filters:
-                new_filtered_list: List[Tuple[Text, CachedObject]] = []
-                for line, cached_obj in self.filtered_list:
-                    for _filter in self.filters:
-                        if _filter(cached_obj):
-                            new_filtered_list.append((line, cached_obj))
-                            break
-                self.filtered_list = new_filtered_list
-        self.num_filtered_list_items = len(self.filtered_list)
+    @property
+    def num_filtered_public_attributes(self) -> int:
+        return len(self.filtered_public_keys)
+
+    @property
+    def num_filtered_private_attributes(self) -> int:
+        return len(self.filtered_private_keys)
+
+    @property
+    def num_filtered_dict_keys(self) -> int:
+        return len(self.filtered_dict)
+
+    @property
+    def num_filtered_list_items(self) -> int:
+        return len(self.filtered_list)
+
+    def current_search_matches(self) -> "SearchMatches":
+        return SearchMatches(
+            search_filter=self.search_filter,
+            public_attributes=self.filtered_public_attributes,
+            public_keys=self.filtered_public_keys,
+            private_attributes=self.filtered_private_attributes,
+            private_keys=self.filtered_private_keys,
+            dict_positions=self.filtered_dict.positions,
+        )
+
+    def restore_search(self, matches: "SearchMatches"):
+        """ Go back to the results of a previous search """
+        self.filtered_public_attributes = matches.public_attributes
+        self.filtered_public_keys = matches.public_keys
+        self.filtered_private_attributes = matches.private_attributes
+        self.filtered_private_keys = matches.private_keys
+        self.filtered_dict.positions = matches.dict_positions
 
     def current_visible_attributes(self):
         """ TODO """
@@ -370,23 +781,454 @@ class CachedObject:
                 self._source, "python", line_numbers=True, background_color="default"
             )
         else:
+            # Only highlight the lines that fit in the preview, the source can be a whole module
             return Syntax(
-                self._source,
+                "".join(self.source_lines[:term_height]),
                 "python",
                 line_numbers=True,
                 line_range=(0, term_height),
                 background_color="default",
             )
 
+    @lazy_property
+    def source_lines(self) -> List[str]:
+        return self._source.splitlines(keepends=True)
+
+
+@dataclass
+class ChildRow:
+    """Lightweight record for an attribute of a CachedObject. Building the full `CachedObject`
+    for every attribute up front is slow on objects with thousands of attributes, so it is only
+    built once the row is drawn in the explorer or selected"""
+
+    name: str
+    obj: Any
+    parent_path: Text
+    hidden: bool = False
+    flags: int = field(init=False)
+    lowered_name: str = field(init=False, repr=False)
+    _cached_object: Optional[CachedObject] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self.flags = classify(self.obj)
+        self.lowered_name = self.name.lower()
+
+    @property
+    def cached_object(self) -> CachedObject:
+        if self._cached_object is None:
+            self._cached_object = CachedObject(
+                self.obj,
+                parent_path=self.parent_path,
+                attr_name=self.name,
+                hidden=self.hidden,
+            )
+        return self._cached_object
+
+    @property
+    def is_placeholder(self) -> bool:
+        """ Whether the row is for a submodule that has not been imported yet """
+        return type(self.obj) == UnimportedModule and self.obj.error is None
+
+    def import_module(self):
+        """Import the submodule of a placeholder row and replace the placeholder with it. If the
+        import fails the placeholder is kept, along with the error"""
+        placeholder = self.obj
+        try:
+            module = importlib.import_module(placeholder.name)
+        except Exception as err:
+            placeholder.error = err
+        else:
+            self.obj = module
+            self.flags = classify(module)
+        # The line drawn for the row changes either way
+        self._cached_object = None
+
+    @property
+    def is_unevaluated(self) -> bool:
+        """ Whether the row is for an attribute that has not been read yet """
+        return type(self.obj) == UnevaluatedAttribute and self.obj.error is None
+
+    @property
+    def is_evaluating(self) -> bool:
+        """ Whether the attribute of the row is being read on a thread of its own """
+        return self.is_unevaluated and self.obj.future is not None
+
+    @property
+    def is_hung(self) -> bool:
+        """ Whether the attribute has been read for longer than `attribute_hang_time` """
+        return (
+            self.is_evaluating
+            and time.perf_counter() - self.obj.started > attribute_hang_time
+        )
+
+    def evaluate(self, timeout: float):
+        """Read the attribute of an unevaluated row on a thread of its own, waiting up to `timeout`
+        seconds for it. Once it is done the placeholder is replaced with the value, or with a
+        placeholder that records the error. Until then the row keeps showing the placeholder"""
+        placeholder = self.obj
+        if placeholder.future is None:
+            placeholder.started = time.perf_counter()
+            placeholder.future = run_in_own_thread(
+                getattr,
+                placeholder.owner,
+                placeholder.name,
+                name=f"objexplore-attribute-{placeholder.name}",
+            )
+        if not wait([placeholder.future], timeout).done:
+            return
+
+        error = placeholder.future.exception()
+        if error is None:
+            self.obj = placeholder.future.result()
+            self.flags = classify(self.obj)
+        else:
+            self.obj = UnevaluatedAttribute(placeholder.owner, placeholder.name, error)
+        self._cached_object = None
+
+    def resolve(self) -> CachedObject:
+        """The full CachedObject of the row, importing the submodule or reading the attribute first
+        if the row is a placeholder"""
+        if self.is_placeholder:
+            self.import_module()
+        elif self.is_unevaluated:
+            # The first time the row is selected the attribute gets a moment to finish before the
+            # placeholder is shown, after that the explorer only checks if it is done
+            self.evaluate(0 if self.is_evaluating else attribute_time_budget)
+        return self.cached_object
+
 
 @dataclass
-class FilteredDictKey:
-    """ TODO """
+class SearchMatches:
+    """ The filtered children of a CachedObject for one search string """
+
+    search_filter: str
+    public_attributes: Dict[str, ChildRow]
+    public_keys: List[str]
+    private_attributes: Dict[str, ChildRow]
+    private_keys: List[str]
+    dict_positions: Sequence[int]
+
+
+class DictView:
+    """Filtered view over the items of a dictionary
+
+    The keys and values are snapshotted into lists once and a filter pass only produces the
+    positions of the matching keys, so the view can be indexed like a list. The line drawn for a
+    key and the CachedObject for its value are only built when that key is drawn or selected
+    """
+
+    def __init__(self, parent: CachedObject):
+        self.parent = parent
+        if type(parent.obj) == dict:
+            self.keys: List[Any] = list(parent.obj.keys())
+            self.values: List[Any] = list(parent.obj.values())
+        else:
+            self.keys = []
+            self.values = []
+        # Positions in `self.keys` of the keys that pass the filters
+        self.positions: Sequence[int] = range(len(self.keys))
+        # The `TypeFlag`s of the values, filled in by the filter passes
+        self.flags = array("I")
+        self._lines: Dict[int, Text] = {}
+        self._cached_objects: Dict[int, CachedObject] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @lazy_property
+    def search_index(self) -> SearchIndex:
+        return SearchIndex(self.keys)
+
+    def filter_steps(
+        self,
+        filter_mask: int,
+        search_filter: str,
+        positions: Optional[Sequence[int]] = None,
+        fuzzy_search: bool = False,
+    ) -> Iterator[None]:
+        """Recompute which keys pass the given filters, yielding every `FILTER_CHUNK_SIZE` keys. If
+        `positions` is given only those keys are checked against the search, they have already
+        passed the filters. Keys that are not strings always pass the search. The values are
+        classified along the way the first time they are filtered"""
+        if positions is None:
+            if not filter_mask and not search_filter:
+                self.positions = range(len(self.keys))
+                return
+            positions = range(len(self.keys))
+        else:
+            filter_mask = 0
+
+        scores: Dict[int, int] = {}
+        filtered_positions: List[int] = []
+        self.positions = filtered_positions
+
+        lowered: List[Optional[str]] = []
+        if search_filter:
+            # The keys are only lowercased the first time they are searched
+            yield from self.search_index.build_steps()
+            lowered = self.search_index.lowered
+        for start in range(0, len(positions), FILTER_CHUNK_SIZE):
+            chunk: Iterable[int] = positions[start : start + FILTER_CHUNK_SIZE]
+            if filter_mask:
+                # The positions are all of them in order, so the values are classified a chunk
+                # at a time the first time they are filtered
+                end = min(start + FILTER_CHUNK_SIZE, len(self.values))
+                if len(self.flags) < end:
+                    self.flags.extend(map(classify, self.values[len(self.flags) : end]))
+                # Only keep objects that match the filter
+                flags = map(self.flags.__getitem__, chunk)
+                chunk = compress(chunk, map(filter_mask.__and__, flags))
+
+            if not search_filter:
+                filtered_positions.extend(chunk)
+
+            elif not fuzzy_search:
+                filtered_positions.extend(
+                    position
+                    for position in chunk
+                    if lowered[position] is None
+                    or search_filter in lowered[position]  # type: ignore
+                )
+
+            else:
+                for position in chunk:
+                    name = lowered[position]
+                    score = -1000 if name is None else fuzzy_score(search_filter, name)
+                    if score is not None:
+                        filtered_positions.append(position)
+                        scores[position] = score
+            yield
+
+        if scores:
+            # Best matches first
+            filtered_positions.sort(key=lambda position: -scores[position])
+
+    def line(self, index: int) -> Text:
+        """ Return the line drawn in the explorer for the key at the given index """
+        position = self.positions[index]
+        if position not in self._lines:
+            key = self.keys[position]
+            val = self.values[position]
+            repr_key: Text
+            repr_val: Text
+
+            if type(key) == str:
+                repr_key = console.render_str(f'"{key}"')
+            elif type(key) in (int, float, dict, list, set, tuple, bool, None):
+                repr_key = console.render_str(str(key))
+            else:
+                repr_key = highlighter(str(key))
+
+            repr_val = highlighter(str(type(val)))
+
+            if not is_empty(val):
+                repr_val.style = f"{repr_val.style} dim".strip()
+
+            line = Text(" ") + repr_key + Text(": ") + repr_val
+            line.overflow = "ellipsis"
+            self._lines[position] = line
+
+        return self._lines[position]
+
+    def cached_object(self, index: int) -> CachedObject:
+        """ Return the CachedObject of the value at the given index """
+        position = self.positions[index]
+        if position not in self._cached_objects:
+            self._cached_objects[position] = CachedObject(
+                self.values[position],
+                parent_path=self.parent.dotpath,
+                index=self.keys[position],
+            )
+        return self._cached_objects[position]
+
+
+def item_line(position: int, item: Any) -> Text:
+    """ The line drawn in the explorer for an item of a list, set or iterator """
+    line = (
+        Text(" [", style=Style(color="white"))
+        + Text(str(position), style=Style(color="blue"))
+        + Text("] ", style=Style(color="white"))
+        + get_type_facts(type(item)).typeof
+    )
+    if not is_empty(item):
+        line.style += Style(dim=True)  # type: ignore
+    return line
+
+
+class ListView:
+    """Filtered view over the items of a list, tuple or set
+
+    Like `DictView` a filter pass only produces the positions of the matching items, and the line
+    drawn for an item and its CachedObject are only built when that item is drawn or selected.
+    Lists and tuples are not copied, items are looked up with `__getitem__` as they are needed.
+    Sets can't be indexed, so they are snapshotted a chunk at a time, only as far as has been
+    drawn. A list with millions of items costs no more to show than one with a handful. The list
+    can shrink while it is explored, the items past its end are left out
+    """
+
+    def __init__(self, parent: CachedObject):
+        self.parent = parent
+        self.items: Sequence[Any]
+        if isinstance(parent.obj, (list, tuple)):
+            self.items = parent.obj
+        else:
+            self.items = []
+        # Fills in `self.items` for a set, see `load_items`
+        self.set_iterator: Optional[Iterator[Any]] = None
+        if isinstance(parent.obj, set):
+            self.set_iterator = iter(parent.obj)
+        # Positions of the items that pass the filters
+        self.positions: Sequence[int] = range(self.num_items)
+        # The `TypeFlag`s of the items, filled in by the filter passes
+        self.flags = array("I")
+        self._lines: Dict[int, Text] = {}
+        self._cached_objects: Dict[int, CachedObject] = {}
 
-    text: Text
-    cached_object: CachedObject
+    def __len__(self) -> int:
+        # The positions are in order, only the ones still in the list are counted
+        return bisect_left(self.positions, self.num_items)
 
-    def __iter__(self):
-        # return [self.text, self.cached_object]
-        yield self.text
-        yield self.cached_object
+    @property
+    def num_items(self) -> int:
+        """ The number of items the list or set has now """
+        if self.set_iterator is not None:
+            return len(self.parent.obj)
+        return len(self.items)
+
+    def load_items(self, end: int):
+        """ Snapshot the items of a set up to position `end`, a chunk at a time """
+        if self.set_iterator is None or end <= len(self.items):
+            return
+        count = -(-(end - len(self.items)) // FILTER_CHUNK_SIZE) * FILTER_CHUNK_SIZE
+        try:
+            self.items.extend(islice(self.set_iterator, count))  # type: ignore
+        except RuntimeError:
+            # The set changed size, start over with a full snapshot
+            self.items = list(self.parent.obj)
+            self.set_iterator = None
+
+    def item(self, position: int) -> Any:
+        """ The item at `position`, raises IndexError if the list has shrunk since """
+        self.load_items(position + 1)
+        return self.items[position]
+
+    def filter_steps(self, filter_mask: int) -> Iterator[None]:
+        """Recompute which items pass the filters, yielding every `FILTER_CHUNK_SIZE` items. The
+        items are classified along the way the first time they are filtered"""
+        if not filter_mask:
+            self.positions = range(self.num_items)
+            return
+
+        filtered_positions: List[int] = []
+        self.positions = filtered_positions
+        for start in range(0, self.num_items, FILTER_CHUNK_SIZE):
+            end = min(start + FILTER_CHUNK_SIZE, self.num_items)
+            if len(self.flags) < end:
+                self.load_items(end)
+                self.flags.extend(map(classify, self.items[len(self.flags) : end]))
+            flags = self.flags[start:end]
+            filtered_positions.extend(
+                compress(range(start, end), map(filter_mask.__and__, flags))
+            )
+            yield
+
+    def index_of(self, position: int) -> Optional[int]:
+        """ The index in the view of the item at `position`, or None if it is filtered out """
+        if isinstance(self.positions, range):
+            return position if 0 <= position < len(self) else None
+        # The filtered positions are in order
+        index = bisect_left(self.positions, position)
+        if index < len(self) and self.positions[index] == position:
+            return index
+        return None
+
+    def line(self, index: int) -> Text:
+        """ Return the line drawn in the explorer for the item at the given index """
+        position = self.positions[index]
+        try:
+            item = self.item(position)
+        except IndexError:
+            # The list shrank after its length was checked
+            return Text(f" [{position}] gone", style=Style(color="white", dim=True))
+        if position not in self._lines:
+            self._lines[position] = item_line(position, item)
+
+        return self._lines[position]
+
+    def cached_object(self, index: int) -> CachedObject:
+        """ Return the CachedObject of the item at the given index """
+        position = self.positions[index]
+        if position not in self._cached_objects:
+            self._cached_objects[position] = CachedObject(
+                self.item(position), parent_path=self.parent.dotpath, index=position
+            )
+        return self._cached_objects[position]
+
+
+class IteratorView:
+    """The items of an iterator, generator or dict view, pulled from it only as far as they have been
+    drawn. Pulling an item consumes it, so the items are kept here to be explored and only the rows
+    down to the last visible one are ever pulled, an infinite iterator is as safe to look at as any
+    other. Dict views are iterated afresh and left untouched"""
+
+    def __init__(self, parent: CachedObject):
+        self.parent = parent
+        self.items: List[Any] = []
+        # Created on the first pull, so a generator is not touched until its items are looked at
+        self.iterator: Optional[Iterator[Any]] = None
+        self.exhausted = False
+        # What the iterator raised, if it stopped with anything other than StopIteration
+        self.error: Optional[Exception] = None
+        self._frame_locals: Optional[DictView] = None
+        self._cached_objects: Dict[int, CachedObject] = {}
+        self._lines: Dict[int, Text] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def load_items(self, end: int):
+        """ Pull items until there are `end` of them or the iterator runs out """
+        if self.exhausted or end <= len(self.items):
+            return
+        try:
+            if self.iterator is None:
+                self.iterator = iter(self.parent.obj)
+            # Whatever was pulled before an error is kept
+            self.items.extend(islice(self.iterator, end - len(self.items)))
+        except Exception as error:
+            self.error = error
+            self.exhausted = True
+        if len(self.items) < end:
+            self.exhausted = True
+        # A generator has moved on, its locals have changed
+        self._frame_locals = None
+
+    @property
+    def frame_locals(self) -> Optional[DictView]:
+        """ The local variables of a generator where it is paused, None if it is not a generator or it has finished """
+        if self._frame_locals is None:
+            frame = getattr(self.parent.obj, "gi_frame", None)
+            if not isinstance(self.parent.obj, GeneratorType) or frame is None:
+                return None
+            self._frame_locals = DictView(
+                CachedObject(
+                    dict(frame.f_locals),
+                    parent_path=self.parent.dotpath,
+                    attr_name="gi_frame.f_locals",
+                )
+            )
+        return self._frame_locals
+
+    def line(self, index: int) -> Text:
+        """ Return the line drawn in the explorer for the item at the given index """
+        if index not in self._lines:
+            self._lines[index] = item_line(index, self.items[index])
+        return self._lines[index]
+
+    def cached_object(self, index: int) -> CachedObject:
+        """ Return the CachedObject of the item at the given index """
+        if index not in self._cached_objects:
+            self._cached_objects[index] = CachedObject(
+                self.items[index], parent_path=self.parent.dotpath, index=index
+            )
+        return self._cached_objects[index]
@@ -4,3 +4,74 @@ from rich.box import (
 )
 
 box_type = ROUNDED
+
+# Seconds spent on background work (filtering, deep search) before drawing and checking for
+# keystrokes again
+background_time_slice = 0.02
+
+# Limits of the deep search, see `deep_search.DeepSearch`
+deep_search_max_depth = 8
+deep_search_max_nodes = 200_000
+deep_search_max_results = 1000
+
+# Number of background threads used for prefetching, see `worker.WorkerPool`
+worker_threads = 2
+
+# Import the submodules of an explored module in the background instead of only when selected
+import_submodules_in_background = False
+
+# Budget of the process wide cache of introspection results, see `introspection.IntrospectionCache`.
+# The size in bytes is a rough estimate
+introspection_cache_max_entries = 20_000
+introspection_cache_max_bytes = 64 * 1024 * 1024
+
+# Keep attribute lists, docstrings and source spans of modules and the classes and functions defined in
+# them on disk, so the next session starts warm, see `persistent_cache.PersistentCache`. Stored in
+# the user cache directory unless a directory is given. Read each time `explore()` is called, which
+# can also turn it on or off, as can the OBJEXPLORE_PERSISTENT_CACHE environment variable
+persistent_cache_enabled = False
+persistent_cache_dir = None
+
+# Most frames drawn per second. Keys that arrive in between are applied together before the next
+# frame. 0 for no limit
+max_frame_rate = 60
+
+# Number of rendered overview panels kept around, so moving back and forth between a few objects
+# doesn't lay out their previews again, see `render_cache.RenderCache`
+render_cache_max_entries = 32
+
+# Seconds a frame waits for the overview of the selected object, which is rendered in the background,
+# before drawing it with a placeholder in place of the preview
+overview_render_wait = 0.01
+
+# Seconds after which the explorer stops waiting on a background render that is still going. It is
+# still drawn once it finishes, but no longer keeps the explorer busy
+render_hang_time = 5.0
+
+# Seconds spent on the repr of an object shown in a title or label before giving up on it and
+# showing its type and address instead, see `bounded_repr.BoundedRepr`
+repr_time_budget = 0.05
+
+# Attributes that run code when read (e.g. properties) are only read once selected, on a thread
+# of their own. Seconds the explorer waits for one before showing it as pending
+attribute_time_budget = 0.1
+
+# Seconds after which the explorer stops waiting on an attribute that is still being read. It keeps
+# running on its own thread and is shown once it finishes, but no longer keeps the explorer busy
+attribute_hang_time = 5.0
+
+# Types whose `__len__` is written in Python but is known to be cheap. `len()` of any other object
+# with a `__len__` written in Python could evaluate a whole lazy collection (e.g. an ORM query), so
+# it is only shown once asked for, see `introspection.TypeFacts.len_is_cheap`
+cheap_len_types = {
+    "collections.UserDict",
+    "collections.UserList",
+    "collections.UserString",
+    "pandas.core.frame.DataFrame",
+    "pandas.core.series.Series",
+    "pandas.core.indexes.base.Index",
+}
+
+# `len()` of a type that took less than this many seconds when asked for is called without asking
+# for the rest of its instances
+cheap_len_time = 0.01
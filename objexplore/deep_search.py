@@ -0,0 +1,299 @@
+from collections import deque
+from dataclasses import dataclass
+import inspect
+import time
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from blessed import Terminal
+from rich.console import Console
+from rich.highlighter import ReprHighlighter
+from rich.layout import Layout
+from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
+
+from .cached_object import CachedObject
+from .config import (
+    box_type,
+    deep_search_max_depth,
+    deep_search_max_nodes,
+    deep_search_max_results,
+)
+
+console = Console()
+highlighter = ReprHighlighter()
+
+# How many objects and children are looked at before checking if the search has used up its time
+DEEP_SEARCH_CHUNK_SIZE = 128
+
+# Values whose text is searched along with their name
+SCALAR_TYPES = (str, int, float, bool, bytes)
+
+
+@dataclass
+class DeepSearchResult:
+    """ An object found by the deep search and the path to it from where the search started """
+
+    path: str
+    obj: Any
+
+
+def iter_children(obj: Any, path: str) -> Iterator[Tuple[Optional[str], str, Any]]:
+    """Yield the (name, path, child) of each child of `obj` the deep search can follow. Attributes are
+    only read from the object's `__dict__` so no properties are evaluated along the way. Children
+    of list and tuples have no name. Children are read as they are needed, the search can stop
+    partway through a huge container"""
+    if isinstance(obj, dict):
+        for key, child in obj.items():
+            if type(key) == str:
+                yield key, f'{path}["{key}"]', child
+            else:
+                yield str(key), f"{path}[{key!r}]", child
+
+    elif isinstance(obj, (list, tuple)):
+        for index, child in enumerate(obj):
+            yield None, f"{path}[{index}]", child
+
+    else:
+        try:
+            attributes = vars(obj)
+        except TypeError:
+            return
+        for name, child in attributes.items():
+            if type(name) == str and not (name.startswith("__") and name.endswith("__")):
+                yield name, f"{path}.{name}", child
+
+
+def can_descend(obj: Any) -> bool:
+    """Whether the deep search should look at the children of `obj`. Modules are not followed, or
+    the search would wander off into every imported package"""
+    return not (
+        isinstance(obj, SCALAR_TYPES)
+        or obj is None
+        or inspect.ismodule(obj)
+        or inspect.isroutine(obj)
+    )
+
+
+def matches(query: str, name: Optional[str], obj: Any) -> bool:
+    if name is not None and query in name.lower():
+        return True
+    if type(obj) == str:
+        # Don't lowercase the whole of a huge string
+        return query in obj[:10000].lower()
+    if isinstance(obj, bytes):
+        # Nor turn the whole of a huge blob into a string
+        return query in repr(obj[:10000]).lower()
+    if isinstance(obj, int) and obj.bit_length() > 30000:
+        # Turning a huge int into decimal is slow, and not allowed at all past 4300 digits
+        return False
+    if isinstance(obj, SCALAR_TYPES):
+        return query in repr(obj)[:10000].lower()
+    return False
+
+
+class DeepSearch:
+    """Search the names and values of everything reachable from the explored object, not just its
+    direct children. The object graph is walked breadth first and the results are shown as they
+    are found"""
+
+    def __init__(self, term: Terminal):
+        self.term = term
+        self.layout = Layout(visible=False)
+        self.receiving_input = False
+        self.query = ""
+        self.results: List[DeepSearchResult] = []
+        self.index = 0
+        self.window = 0
+        self.num_visited = 0
+        # The search that is still running, if any
+        self.pending_search: Optional[Iterator[None]] = None
+
+    def open_input(self):
+        self.layout.visible = True
+        self.receiving_input = True
+
+    def add_search_char(self, key: str):
+        self.query += key
+
+    def backspace(self):
+        if self.query:
+            self.query = self.query[:-1]
+        else:
+            self.cancel()
+
+    def cancel(self):
+        self.receiving_input = False
+        self.layout.visible = False
+        self.pending_search = None
+
+    def start(self, cached_obj: CachedObject):
+        """ Start searching everything reachable from the given object """
+        self.receiving_input = False
+        self.results = []
+        self.index = 0
+        self.window = 0
+        self.num_visited = 0
+        self.pending_search = (
+            self.search_steps(cached_obj.obj, cached_obj.dotpath.plain)
+            if self.query
+            else None
+        )
+
+    def run_pending_search(self, time_budget: float) -> bool:
+        """Continue the current search for up to `time_budget` seconds.
+        Return True if the search has finished"""
+        if self.pending_search is None:
+            return True
+
+        deadline = time.perf_counter() + time_budget
+        for _ in self.pending_search:
+            if time.perf_counter() > deadline:
+                return False
+
+        self.pending_search = None
+        return True
+
+    def search_steps(self, root: Any, root_path: str) -> Iterator[None]:
+        """Walk the object graph breadth first starting from `root`, adding every match to the results.
+        Every object is only visited once (by identity), and the search stops once it has gone
+        `deep_search_max_depth` levels deep or looked at `deep_search_max_nodes` objects, every
+        child counting as one"""
+        query = self.query.lower()
+        queue: Deque[Tuple[Any, str, int]] = deque([(root, root_path, 0)])
+        # Keep a reference to every visited object, otherwise their ids could be reused
+        visited: Dict[int, Any] = {id(root): root}
+        self.num_visited = 1
+        steps = 0
+
+        while queue:
+            obj, path, depth = queue.popleft()
+            children = iter_children(obj, path)
+
+            while True:
+                steps += 1
+                if steps % DEEP_SEARCH_CHUNK_SIZE == 0:
+                    yield
+                try:
+                    name, child_path, child = next(children)
+                except StopIteration:
+                    break
+                except Exception:
+                    # Objects can raise anything while their children are being listed, e.g. a
+                    # dict that changes size. The children already seen are kept
+                    break
+
+                self.num_visited += 1
+                try:
+                    if matches(query, name, child):
+                        self.results.append(DeepSearchResult(path=child_path, obj=child))
+                        if len(self.results) >= deep_search_max_results:
+                            return
+
+                    if (
+                        depth + 1 < deep_search_max_depth
+                        and id(child) not in visited
+                        and can_descend(child)
+                    ):
+                        visited[id(child)] = child
+                        queue.append((child, child_path, depth + 1))
+                except Exception:
+                    # Nor can a single child stop the search of its siblings
+                    pass
+
+                if self.num_visited >= deep_search_max_nodes:
+                    return
+
+    @property
+    def selected_result(self) -> Optional[DeepSearchResult]:
+        if self.index < len(self.results):
+            return self.results[self.index]
+        return None
+
+    @property
+    def num_lines(self) -> int:
+        return self.size - 2
+
+    @property
+    def size(self) -> int:
+        return max((self.term.height - 2) // 2, 5)
+
+    def move_up(self):
+        if self.index > 0:
+            self.index -= 1
+            if self.index < self.window:
+                self.window -= 1
+
+    def move_down(self):
+        if self.index < len(self.results) - 1:
+            self.index += 1
+            if self.index >= self.window + self.num_lines:
+                self.window += 1
+
+    def move_top(self):
+        self.index = self.window = 0
+
+    def move_bottom(self):
+        self.index = max(len(self.results) - 1, 0)
+        self.window = max(self.index - self.num_lines + 1, 0)
+
+    def get_layout(self, width: int) -> Layout:
+        if self.receiving_input:
+            return self.get_input_layout()
+
+        lines = []
+        for index, result in enumerate(
+            self.results[self.window : self.window + self.num_lines], start=self.window
+        ):
+            line = Text(result.path, style=Style(color="cyan"))
+            if index == self.index:
+                line.style += Style(reverse=True)  # type: ignore
+            line.truncate(width, overflow="ellipsis")
+            lines.append(line)
+
+        if not lines:
+            lines.append(
+                Text(
+                    "Searching..." if self.pending_search else "No results",
+                    style=Style(color="red", italic=True),
+                )
+            )
+
+        status = f"[magenta]{len(self.results)}[/magenta] found"
+        if self.pending_search:
+            status += f", [magenta]{self.num_visited}[/magenta] visited"
+        subtitle = f"[dim][u]space[/u]:select[/dim] ({status})"
+        if len(console.render_str(subtitle)) > width:
+            subtitle = f"({status})"
+
+        self.layout.update(
+            Panel(
+                Text("\n").join(lines),
+                title=f"\\[deep search: {self.query}]",
+                title_align="right",
+                subtitle=subtitle,
+                subtitle_align="right",
+                style="gold1",
+                box=box_type,
+            )
+        )
+        self.layout.size = self.size
+        return self.layout
+
+    def get_input_layout(self) -> Layout:
+        search_text = Text(self.query) + Text(
+            "█", style=Style(underline=True, blink=True, reverse=True)
+        )
+        self.layout.update(
+            Panel(
+                search_text,
+                title="\\[deep search]",
+                title_align="right",
+                subtitle="[dim][u]enter[/u]:search [u]esc[/u]:cancel",
+                subtitle_align="right",
+                style=Style(color="gold1"),
+                box=box_type,
+            )
+        )
+        self.layout.size = 3
+        return self.layout
@@ -1,4 +1,5 @@
-from typing import Optional
+from types import GeneratorType
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from blessed import Terminal
 from rich.console import Console
@@ -8,7 +9,15 @@ from rich.panel import Panel
 from rich.style import Style
 from rich.text import Text
 
-from .cached_object import CachedObject
+from .cached_object import (
+    CachedObject,
+    ChildRow,
+    DictView,
+    IteratorView,
+    UnevaluatedAttribute,
+    UnimportedModule,
+)
+from .deep_search import DeepSearch
 from .filter import Filter
 from .stack import Stack, StackFrame
 from .config import box_type
@@ -25,6 +34,81 @@ class ExplorerState:
     list = "ExplorerState.list"
     tuple = "ExplorerState.tuple"
     set = "ExplorerState.set"
+    items = "ExplorerState.items"
+    locals = "ExplorerState.locals"
+
+
+# The names of the panes `[` and `]` switch between
+PANE_NAMES = {
+    ExplorerState.public: "public",
+    ExplorerState.private: "private",
+    ExplorerState.items: "items",
+    ExplorerState.locals: "locals",
+}
+
+# `Explorer.row_cache` is emptied once it holds more rows than this
+ROW_CACHE_SIZE = 2000
+
+
+def visible_rows(
+    row_line: Callable[[int], Text],
+    start: int,
+    end: int,
+    selected_index: int,
+    width: int,
+    cache: Dict[int, Tuple[Text, int, Text]],
+    keep_style: bool = False,
+) -> List[Text]:
+    """Build the lines of the rows from `start` up to `end`, highlighting the selected row. Only the
+    rows in the window are ever built, so drawing a panel costs the same however many rows it has.
+    The truncated lines are kept in `cache` and only the selected row is restyled on each frame.
+    The selected row keeps its own style on top of the highlight if `keep_style` is set"""
+    if len(cache) > ROW_CACHE_SIZE:
+        cache.clear()
+
+    lines = []
+    for index in range(start, end):
+        line = row_line(index)
+        entry = cache.get(id(line))
+        if entry is None or entry[0] is not line or entry[1] != width:
+            truncated = line.copy()
+            truncated.truncate(width)
+            entry = cache[id(line)] = (line, width, truncated)
+
+        truncated = entry[2]
+        if index == selected_index:
+            truncated = truncated.copy()
+            if keep_style:
+                truncated.style += Style(reverse=True)  # type: ignore
+            else:
+                truncated.style = Style(reverse=True)
+        lines.append(truncated)
+    return lines
+
+
+def scroll_up(index: int, window: int, amount: int) -> Tuple[int, int, int]:
+    """Move `index` up by `amount` without going past 0, scrolling the `window` along like moving one
+    line at a time would. Return the new index and window, and how many moves were left over"""
+    steps = min(amount, max(index, 0))
+    if window > index:
+        window -= steps
+    else:
+        window = min(window, index - steps)
+    return index - steps, window, amount - steps
+
+
+def scroll_down(
+    index: int, window: int, amount: int, last_index: int, num_lines: int
+) -> Tuple[int, int, int]:
+    """Move `index` down by `amount` without going past `last_index`, scrolling the `window` of
+    `num_lines` lines along like moving one line at a time would. Return the new index and window,
+    and how many moves were left over"""
+    steps = min(amount, max(last_index - index, 0))
+    if index >= window + num_lines:
+        window += steps
+    else:
+        window = max(window, index + steps - num_lines + 1)
+    return index + steps, window, amount - steps
 
 
 def get_state(cached_obj: CachedObject):
@@ -60,6 +144,7 @@ class Explorer:
         term: Terminal,
         filter: Optional[Filter] = None,
         stack: Optional[Stack] = None,
+        deep_search: Optional[DeepSearch] = None,
         state: Optional[str] = None,
         public_index: int = 0,
         public_window: int = 0,
@@ -74,6 +159,7 @@ class Explorer:
         self.term = term
         self.filter = Filter(term=self.term) if not filter else filter
         self.stack = Stack(head_obj=cached_obj) if not stack else stack
+        self.deep_search = DeepSearch(term=self.term) if not deep_search else deep_search
         self.public_index = public_index
         self.public_window = public_window
         self.private_index = private_index
@@ -83,6 +169,10 @@ class Explorer:
         self.list_index = list_index
         self.list_window = list_window
         self.extra_width = 0
+        # The digits typed after pressing `:` to go to an index, None when not typing one
+        self.index_input: Optional[str] = None
+        # The truncated lines of the rows drawn so far, see `visible_rows`
+        self.row_cache: Dict[int, Tuple[Text, int, Text]] = {}
 
         if state:
             self.state = state
@@ -99,10 +189,19 @@ class Explorer:
         elif self.state in (ExplorerState.list, ExplorerState.tuple, ExplorerState.set):
             top_panel = self.list_panel
 
+        elif self.state in (ExplorerState.items, ExplorerState.locals):
+            top_panel = self.peek_panel
+
         else:
             top_panel = self.dir_panel
 
-        if self.filter.layout.visible:
+        if self.deep_search.layout.visible:
+            combined_layout = Layout()
+            combined_layout.split_column(
+                top_panel, self.deep_search.get_layout(self.text_width)
+            )
+            explorer_layout.update(combined_layout)
+        elif self.filter.layout.visible:
             combined_layout = Layout()
             combined_layout.split_column(
                 top_panel, self.filter.get_layout(self.text_width)
@@ -128,32 +227,30 @@ class Explorer:
 
         if self.state == ExplorerState.public:
             # Reset the public index / window in case applying a filter has now moved the index
-            # farther down than it can access on the filtered attributes
-            if self.public_index >= len(self.cached_obj.filtered_public_attributes):
+            # farther down than it can access on the filtered attributes. Wait until any filter pass that
+            # is still running has finished, the filtered attributes may only be partially filled in
+            if (
+                self.public_index >= len(self.cached_obj.filtered_public_attributes)
+                and not self.cached_obj.pending_filter
+            ):
                 self.public_index = max(
                     0, len(self.cached_obj.filtered_public_attributes) - 1
                 )
                 self.public_window = max(0, self.public_index - self.num_lines)
 
-            for index, (attr, cached_obj) in enumerate(
-                self.cached_obj.filtered_public_attributes.items()
-            ):
-                line = cached_obj.text.copy()
-                if index == self.public_index:
-                    line.style += Style(reverse=True)  # type: ignore
-
-                # dim_typeof = cached_obj.typeof.copy()
-                # dim_typeof.style = Style(dim=True)
-                # line = (
-                #     line
-                #     + Text(" " * max(2, panel_width - (len(line) + len(cached_obj.typeof))))
-                #     + dim_typeof
-                # )
-
-                line.truncate(self.text_width)
-                lines.append(line)
-
-            title = "[i][cyan]dir[/cyan]()[/i] | [u]public[/u] [dim]private[/dim]"
+            public_keys = self.cached_obj.filtered_public_keys
+            public_attributes = self.cached_obj.filtered_public_attributes
+            lines = visible_rows(
+                lambda index: public_attributes[public_keys[index]].cached_object.text,
+                self.public_window,
+                min(self.public_window + self.num_lines + 1, len(public_keys)),
+                self.public_index,
+                self.text_width,
+                self.row_cache,
+                keep_style=True,
+            )
+
+            title = self.pane_title
             subtitle_help = "[dim][u][][/u]:switch pane [/dim]"
             subtitle_index = (
                 f"[white]([/white][magenta]{self.public_index + 1 if self.cached_obj.filtered_public_attributes else 0}"
@@ -171,37 +268,32 @@ class Explorer:
                     Text("No public attributes", style=Style(color="red", italic=True))
                 )
 
-            lines = lines[self.public_window : self.public_window + self.num_lines + 1]
-
         elif self.state == ExplorerState.private:
             # Reset the private index / window in case applying a filter has now moved the index
-            # farther down than it can access on the filtered attributes
-            if self.private_index >= len(self.cached_obj.filtered_private_attributes):
+            # farther down than it can access on the filtered attributes. Wait until any filter pass that
+            # is still running has finished, the filtered attributes may only be partially filled in
+            if (
+                self.private_index >= len(self.cached_obj.filtered_private_attributes)
+                and not self.cached_obj.pending_filter
+            ):
                 self.private_index = max(
                     0, len(self.cached_obj.filtered_private_attributes) - 1
                 )
                 self.private_window = max(0, self.private_index - self.num_lines)
 
-            for index, (attr, cached_obj) in enumerate(
-                self.cached_obj.filtered_private_attributes.items()
-            ):
-                line = cached_obj.text.copy()
-                if index == self.private_index:
-                    line.style += Style(reverse=True)  # type: ignore
-
-                # TODO add a toggle able feature for this
-                # dim_typeof = cached_obj.typeof.copy()
-                # dim_typeof.style = Style(dim=True)
-                # line = (
-                #     line
-                #     + Text(" " * max(2, panel_width - (len(line) + len(cached_obj.typeof))))
-                #     + dim_typeof
-                # )
-
-                line.truncate(self.text_width)
-                lines.append(line)
-
-            title = "[i][cyan]dir[/cyan]()[/i] | [dim]public[/dim] [u]private[/u]"
+            private_keys = self.cached_obj.filtered_private_keys
+            private_attributes = self.cached_obj.filtered_private_attributes
+            lines = visible_rows(
+                lambda index: private_attributes[private_keys[index]].cached_object.text,
+                self.private_window,
+                min(self.private_window + self.num_lines, len(private_keys)),
+                self.private_index,
+                self.text_width,
+                self.row_cache,
+                keep_style=True,
+            )
+
+            title = self.pane_title
             subtitle = (
                 "[dim][u][][/u]:switch pane [/dim]"
                 f"[white]([/white][magenta]{self.private_index + 1 if self.cached_obj.filtered_private_attributes else 0}"
@@ -212,22 +304,8 @@ class Explorer:
                     Text("No private attributes", style=Style(color="red", italic=True))
                 )
 
-            lines = lines[self.private_window : self.private_window + self.num_lines]
-
         if self.num_hidden_attributes:
-            num_filtered_line = (
-                Text(
-                    "+",
-                    style=Style(color="white", dim=True, italic=True, underline=True),
-                )
-                + Text(
-                    str(self.num_hidden_attributes),
-                    style=Style(color="cyan", dim=True, italic=True),
-                )
-                + Text(" filtered", style=Style(color="white", dim=True, italic=True))
-            )
-            num_filtered_line.truncate(self.text_width)
-            lines.append(num_filtered_line)
+            lines.append(self.num_filtered_line)
 
         renderable = Text("\n").join(lines)
 
@@ -235,10 +313,7 @@ class Explorer:
         if self.text_width < len(console.render_str(title)) + 3:
             title = title.split("|")[-1].strip()
         if len(console.render_str(title)) > self.text_width:
-            if self.state == ExplorerState.public:
-                title = "[u]public"
-            elif self.state == ExplorerState.private:
-                title = "[u]private"
+            title = f"[u]{PANE_NAMES[self.state]}"
 
         return Panel(
             renderable,
@@ -255,8 +330,12 @@ class Explorer:
         """ Return the dictionary explorer layout """
 
         # Reset the dict index / window in case applying a filter has now moved the index
-        # farther down than it can access on the filtered attributes
-        if self.dict_index >= len(self.cached_obj.filtered_dict):
+        # farther down than it can access on the filtered attributes. Wait until any filter pass that
+        # is still running has finished, the filtered attributes may only be partially filled in
+        if (
+            self.dict_index >= len(self.cached_obj.filtered_dict)
+            and not self.cached_obj.pending_filter
+        ):
             self.dict_index = max(0, len(self.cached_obj.filtered_dict) - 1)
             self.dict_window = max(0, self.dict_index - self.num_lines)
 
@@ -273,38 +352,23 @@ class Explorer:
             start = self.dict_window - 1
             num_lines = self.num_lines
 
-        end = start + num_lines
-        index = start
-
-        for attr, (line, cached_obj) in list(self.cached_obj.filtered_dict.items())[
-            start:end
-        ]:
-            new_line = line.copy()
-            if index == self.dict_index:
-                new_line.style = Style(reverse=True)
+        end = min(start + num_lines, len(self.cached_obj.filtered_dict))
 
-            new_line.truncate(self.text_width)
-            lines.append(new_line)
-            index += 1
+        lines += visible_rows(
+            self.cached_obj.filtered_dict.line,
+            start,
+            end,
+            self.dict_index,
+            self.text_width,
+            self.row_cache,
+        )
 
         if len(lines) == 1:
             lines[0] = Text("{}")
         else:
             lines.append(Text("}"))
         if self.num_hidden_attributes:
-            num_filtered_line = (
-                Text(
-                    "+",
-                    style=Style(color="white", dim=True, italic=True, underline=True),
-                )
-                + Text(
-                    str(self.num_hidden_attributes),
-                    style=Style(color="cyan", dim=True, italic=True),
-                )
-                + Text(" filtered", style=Style(color="white", dim=True, italic=True))
-            )
-            num_filtered_line.truncate(self.text_width)
-            lines.append(num_filtered_line)
+            lines.append(self.num_filtered_line)
 
         text = Text("\n").join(lines)
 
@@ -312,7 +376,9 @@ class Explorer:
             text,
             title="[i][cyan]dict[/cyan]()",
             title_align="right",
-            subtitle=f"([magenta]{self.dict_index + 1}[/magenta]/[magenta]{len(self.cached_obj.filtered_dict)}[/magenta])",
+            subtitle=self.index_subtitle(
+                self.dict_index, len(self.cached_obj.filtered_dict)
+            ),
             subtitle_align="right",
             style="white",
             box=box_type,
@@ -322,8 +388,12 @@ class Explorer:
     def list_panel(self) -> Panel:
         """ TODO """
         # Reset the list index / window in case applying a filter has now moved the index
-        # farther down than it can access on the filtered attributes
-        if self.list_index >= len(self.cached_obj.filtered_list):
+        # farther down than it can access on the filtered attributes. Wait until any filter pass that
+        # is still running has finished, the filtered attributes may only be partially filled in
+        if (
+            self.list_index >= len(self.cached_obj.filtered_list)
+            and not self.cached_obj.pending_filter
+        ):
             self.list_index = max(0, len(self.cached_obj.filtered_list) - 1)
             self.list_window = max(0, self.list_index - self.num_lines)
 
@@ -346,18 +416,15 @@ class Explorer:
             start = self.list_window - 1
             num_lines = self.num_lines
 
-        end = start + num_lines
-        index = start
-
-        for line, cached_obj in self.cached_obj.filtered_list[start:end]:
-            new_line = line.copy()
-
-            if index == self.list_index:
-                new_line.style = Style(reverse=True)
-
-            new_line.truncate(self.text_width)
-            lines.append(new_line)
-            index += 1
+        end = min(start + num_lines, len(self.cached_obj.filtered_list))
+        lines += visible_rows(
+            self.cached_obj.filtered_list.line,
+            start,
+            end,
+            self.list_index,
+            self.text_width,
+            self.row_cache,
+        )
 
         if len(lines) == 1:
             lines[0] = Text("".join(bracket_map[self.state][:-1]))
@@ -365,19 +432,7 @@ class Explorer:
             lines.append(Text(bracket_map[self.state][1]))
 
         if self.num_hidden_attributes:
-            num_filtered_line = (
-                Text(
-                    "+",
-                    style=Style(color="white", dim=True, italic=True, underline=True),
-                )
-                + Text(
-                    str(self.num_hidden_attributes),
-                    style=Style(color="cyan", dim=True, italic=True),
-                )
-                + Text(" filtered", style=Style(color="white", dim=True, italic=True))
-            )
-            num_filtered_line.truncate(self.text_width)
-            lines.append(num_filtered_line)
+            lines.append(self.num_filtered_line)
 
         text = Text("\n").join(lines)
 
@@ -385,14 +440,146 @@ class Explorer:
             text,
             title=f"[i][cyan]{bracket_map[self.state][2]}[/cyan]()",
             title_align="right",
-            subtitle=f"([magenta]{self.list_index + 1}[/magenta]/[magenta]{len(self.cached_obj.filtered_list)}[/magenta])",
+            subtitle=self.index_subtitle(
+                self.list_index, len(self.cached_obj.filtered_list)
+            ),
             subtitle_align="right",
             style="white",
             box=box_type,
         )
 
+    @property
+    def peek_panel(self) -> Panel:
+        """ The items pulled from an iterator so far, or the local variables of a generator """
+        peeked = self.cached_obj.peeked_items
+        if self.state == ExplorerState.items:
+            # Only pull the items down to the last visible row
+            peeked.load_items(self.list_window + self.num_lines)
+
+        view = self.peek_view
+        num_rows = len(view) if view is not None else 0
+        if self.state == ExplorerState.items:
+            index, window = self.list_index, self.list_window
+        else:
+            # The locals are snapshotted again each time the generator moves on
+            if self.dict_index >= num_rows:
+                self.dict_index = max(0, num_rows - 1)
+                self.dict_window = max(0, self.dict_index - self.num_lines + 1)
+            index, window = self.dict_index, self.dict_window
+
+        lines = []
+        if view is not None:
+            lines = visible_rows(
+                view.line,
+                window,
+                min(window + self.num_lines, num_rows),
+                index,
+                self.text_width,
+                self.row_cache,
+            )
+
+        if self.state == ExplorerState.items and peeked.error is not None:
+            error = Text(
+                f"Raised {type(peeked.error).__name__}: {peeked.error}",
+                style=Style(color="red", italic=True),
+            )
+            error.truncate(self.text_width, overflow="ellipsis")
+            lines.append(error)
+        elif not lines:
+            lines.append(
+                Text(
+                    "No items" if self.state == ExplorerState.items else "No local variables",
+                    style=Style(color="red", italic=True),
+                )
+            )
+
+        # The total is not known until the iterator has run out
+        more = "+" if self.state == ExplorerState.items and not peeked.exhausted else ""
+        subtitle_index = (
+            f"[white]([/white][magenta]{index + 1 if num_rows else 0}"
+            f"[/magenta][white]/[/white][magenta]{num_rows}{more}[/magenta][white])"
+        )
+        subtitle = "[dim][u][][/u]:switch pane [/dim]" + subtitle_index
+        if len(console.render_str(subtitle)) >= self.text_width - 2:
+            subtitle = subtitle_index
+
+        title = self.pane_title
+        if self.text_width < len(console.render_str(title)) + 3:
+            title = title.split("|")[-1].strip()
+        if len(console.render_str(title)) > self.text_width:
+            title = f"[u]{PANE_NAMES[self.state]}"
+
+        return Panel(
+            Text("\n").join(lines),
+            title=title,
+            title_align="right",
+            subtitle=subtitle,
+            subtitle_align="right",
+            style="white",
+            box=box_type,
+        )
+
+    @property
+    def panes(self) -> List[str]:
+        """The panes `[` and `]` switch between. Iterators also have the items peeked from them, and
+        generators their local variables"""
+        panes = [ExplorerState.public, ExplorerState.private]
+        if self.cached_obj.peekable:
+            panes.append(ExplorerState.items)
+            if isinstance(self.cached_obj.obj, GeneratorType):
+                panes.append(ExplorerState.locals)
+        return panes
+
+    @property
+    def pane_title(self) -> str:
+        """ The names of the panes, the current one underlined """
+        names = [
+            f"[u]{PANE_NAMES[pane]}[/u]"
+            if pane == self.state
+            else f"[dim]{PANE_NAMES[pane]}[/dim]"
+            for pane in self.panes
+        ]
+        return "[i][cyan]dir[/cyan]()[/i] | " + " ".join(names)
+
+    def switch_pane(self, step: int = 1):
+        """ Switch `step` panes to the right, wrapping around. Dicts and lists only have the one pane """
+        panes = self.panes
+        if self.state in panes:
+            self.state = panes[(panes.index(self.state) + step) % len(panes)]
+
+    @property
+    def peek_view(self) -> Optional[Union[IteratorView, DictView]]:
+        """ The rows of the items or locals pane """
+        if self.state == ExplorerState.items:
+            return self.cached_obj.peeked_items
+        elif self.state == ExplorerState.locals:
+            return self.cached_obj.peeked_items.frame_locals
+        return None
+
+    def index_subtitle(self, index: int, total: int) -> str:
+        if self.index_input is not None:
+            return f"[u]go to index[/u]: {self.index_input}█"
+        return f"([magenta]{index + 1}[/magenta]/[magenta]{total}[/magenta])"
+
     def explore_selected_object(self) -> Optional[CachedObject]:
-        """ TODO """
+        """Explore the selected object and return it. Returns None if the selected attribute is not
+        ready yet, see `selection_ready`"""
+        if not self.selection_ready:
+            return None
+        cached_obj = self.selected_object
+        self.explore(cached_obj)
+        return cached_obj
+
+    def explore_deep_search_result(self):
+        """ Explore the object selected in the deep search results """
+        result = self.deep_search.selected_result
+        if result is None:
+            return
+        self.deep_search.layout.visible = False
+        self.explore(CachedObject(result.obj, attr_name=result.path))
+
+    def explore(self, cached_obj: CachedObject) -> Optional[CachedObject]:
+        """ Push the current object onto the stack and start exploring the given object """
 
         # Save current stack as a frame
         current_frame = StackFrame(
@@ -410,10 +597,13 @@ class Explorer:
         )
         self.stack.push(current_frame)
 
-        self.cached_obj = self.selected_object
+        self.cached_obj = cached_obj
         self.cached_obj.cache()
         self.state = get_state(self.cached_obj)
         self.filter = Filter(term=self.term)
+        # The object may have been explored before with other filters
+        if self.cached_obj.filter_mask or self.cached_obj.search_filter:
+            self.cached_obj.set_filters(0)
         self.public_index = 0
         self.public_window = 0
         self.private_index = 0
@@ -460,83 +650,159 @@ class Explorer:
 
         return self.cached_obj
 
-    def move_up(self):
-        """ Move the current selection up one """
+    def move_up(self, amount: int = 1):
+        """Move the current selection up by `amount`, the same as moving up one line `amount` times
+        but without going through every line in between"""
         if self.state == ExplorerState.public:
-            if self.public_index > 0:
-                self.public_index -= 1
-                if self.public_index < self.public_window:
-                    self.public_window -= 1
+            self.public_index, self.public_window, _ = scroll_up(
+                self.public_index, self.public_window, amount
+            )
 
         elif self.state == ExplorerState.private:
-            if self.private_index > 0:
-                self.private_index -= 1
-                if self.private_index < self.private_window:
-                    self.private_window -= 1
+            self.private_index, self.private_window, _ = scroll_up(
+                self.private_index, self.private_window, amount
+            )
 
         elif self.state == ExplorerState.dict:
-            if self.dict_index > 0:
-                self.dict_index -= 1
-                if self.dict_index < self.dict_window - 1:
-                    self.dict_window -= 1
-            elif self.dict_window == 1:
+            # The first line of the dict panel is the opening brace
+            self.dict_index, window, left_over = scroll_up(
+                self.dict_index, self.dict_window - 1, amount
+            )
+            self.dict_window = window + 1
+            if left_over and self.dict_window == 1:
                 self.dict_window -= 1
 
         elif self.state in (ExplorerState.list, ExplorerState.tuple, ExplorerState.set):
-            if self.list_index > 0:
-                self.list_index -= 1
-                if self.list_index < self.list_window - 1:
-                    self.list_window -= 1
-            elif self.list_window == 1:
+            self.list_index, window, left_over = scroll_up(
+                self.list_index, self.list_window - 1, amount
+            )
+            self.list_window = window + 1
+            if left_over and self.list_window == 1:
                 self.list_window -= 1
 
-    def move_down(self):
-        """ Move the current selection down one """
+        elif self.state == ExplorerState.items:
+            self.list_index, self.list_window, _ = scroll_up(
+                self.list_index, self.list_window, amount
+            )
+
+        elif self.state == ExplorerState.locals:
+            self.dict_index, self.dict_window, _ = scroll_up(
+                self.dict_index, self.dict_window, amount
+            )
+
+    def move_down(self, amount: int = 1):
+        """Move the current selection down by `amount`, the same as moving down one line `amount`
+        times but without going through every line in between"""
+        if self.state == ExplorerState.items:
+            # Pull just enough items to move onto
+            self.cached_obj.peeked_items.load_items(self.list_index + amount + 1)
+        last_index = self.num_filtered_attributes - 1
+
         if self.state == ExplorerState.public:
-            if self.public_index < self.num_filtered_attributes - 1:
-                self.public_index += 1
-                if self.public_index >= self.public_window + self.num_lines:
-                    self.public_window += 1
-            elif (
-                self.public_window == self.num_filtered_attributes - self.num_lines + 1
+            self.public_index, self.public_window, left_over = scroll_down(
+                self.public_index,
+                self.public_window,
+                amount,
+                last_index,
+                self.num_lines,
+            )
+            if (
+                left_over
+                and self.public_window
+                == self.num_filtered_attributes - self.num_lines + 1
             ):
                 self.public_window += 1
 
         elif self.state == ExplorerState.private:
-            if self.private_index < self.num_filtered_attributes - 1:
-                self.private_index += 1
-                if self.private_index >= self.private_window + self.num_lines:
-                    self.private_window += 1
-            elif (
-                self.private_window == self.num_filtered_attributes - self.num_lines + 1
+            self.private_index, self.private_window, left_over = scroll_down(
+                self.private_index,
+                self.private_window,
+                amount,
+                last_index,
+                self.num_lines,
+            )
+            if (
+                left_over
+                and self.private_window
+                == self.num_filtered_attributes - self.num_lines + 1
             ):
                 self.private_window += 1
 
         elif self.state == ExplorerState.dict:
-            if self.dict_index < self.num_filtered_attributes - 1:
-                self.dict_index += 1
-                if self.dict_index >= self.dict_window + self.num_lines - 1:
-                    self.dict_window += 1
-            elif self.dict_window == self.num_filtered_attributes - self.num_lines + 1:
-                self.dict_window += 1
-            elif (
-                self.dict_window == self.num_filtered_attributes - self.num_lines + 2
-                and self.num_hidden_attributes > 0
-            ):
-                self.dict_window += 1
+            self.dict_index, self.dict_window, left_over = scroll_down(
+                self.dict_index,
+                self.dict_window,
+                amount,
+                last_index,
+                self.num_lines - 1,
+            )
+            for _ in range(min(left_over, 2)):
+                self.dict_window = self.scroll_past_end(self.dict_window)
 
         elif self.state in (ExplorerState.list, ExplorerState.tuple, ExplorerState.set):
-            if self.list_index < self.num_filtered_attributes - 1:
-                self.list_index += 1
-                if self.list_index >= self.list_window + self.num_lines - 1:
-                    self.list_window += 1
-            elif self.list_window == self.num_filtered_attributes - self.num_lines + 1:
-                self.list_window += 1
-            elif (
-                self.list_window == self.num_filtered_attributes - self.num_lines + 2
-                and self.num_hidden_attributes > 0
-            ):
-                self.list_window += 1
+            self.list_index, self.list_window, left_over = scroll_down(
+                self.list_index,
+                self.list_window,
+                amount,
+                last_index,
+                self.num_lines - 1,
+            )
+            for _ in range(min(left_over, 2)):
+                self.list_window = self.scroll_past_end(self.list_window)
+
+        elif self.state == ExplorerState.items:
+            self.list_index, self.list_window, _ = scroll_down(
+                self.list_index, self.list_window, amount, last_index, self.num_lines
+            )
+
+        elif self.state == ExplorerState.locals:
+            self.dict_index, self.dict_window, _ = scroll_down(
+                self.dict_index, self.dict_window, amount, last_index, self.num_lines
+            )
+
+    def scroll_past_end(self, window: int) -> int:
+        """ Moving down at the end of a dict or list scrolls on to show the closing brace and the hidden line """
+        if window == self.num_filtered_attributes - self.num_lines + 1:
+            return window + 1
+        elif (
+            window == self.num_filtered_attributes - self.num_lines + 2
+            and self.num_hidden_attributes > 0
+        ):
+            return window + 1
+        return window
+
+    def open_index_input(self) -> bool:
+        """ Start typing an index to go to. Only lists, tuples, sets and dicts have one """
+        if self.state not in (
+            ExplorerState.dict,
+            ExplorerState.list,
+            ExplorerState.tuple,
+            ExplorerState.set,
+        ):
+            return False
+        self.index_input = ""
+        return True
+
+    def go_to_index(self, index: int) -> bool:
+        """Select the item at `index` of a list, tuple or set, or the `index`th key of a dict, scrolling
+        it into view like moving there one line at a time would. Takes the same time however far away
+        the index is. Returns False if there is no such item or it is filtered out"""
+        if self.state == ExplorerState.dict:
+            view_index: Optional[int] = (
+                index if index < len(self.cached_obj.filtered_dict) else None
+            )
+            current = self.dict_index
+        else:
+            view_index = self.cached_obj.filtered_list.index_of(index)
+            current = self.list_index
+
+        if view_index is None:
+            return False
+        if view_index > current:
+            self.move_down(view_index - current)
+        else:
+            self.move_up(current - view_index)
+        return True
 
     def move_top(self):
         if self.state == ExplorerState.public:
@@ -553,6 +819,12 @@ class Explorer:
         elif self.state in (ExplorerState.list, ExplorerState.tuple, ExplorerState.set):
             self.list_index = self.list_window = 0
 
+        elif self.state == ExplorerState.items:
+            self.list_index = self.list_window = 0
+
+        elif self.state == ExplorerState.locals:
+            self.dict_index = self.dict_window = 0
+
     def move_bottom(self):
         """Move all the way to the bottom. If there are hidden attributes, make sure to show that line by
         increasing the window index by 1"""
@@ -588,6 +860,13 @@ class Explorer:
                 - self.num_lines
                 + (3 if self.num_hidden_attributes == 0 else 4),
             )
+        elif self.state == ExplorerState.items:
+            # The bottom of what has been pulled so far, an iterator may never end
+            self.list_index = max(0, self.num_filtered_attributes - 1)
+            self.list_window = max(0, self.list_index - self.num_lines + 1)
+        elif self.state == ExplorerState.locals:
+            self.dict_index = max(0, self.num_filtered_attributes - 1)
+            self.dict_window = max(0, self.dict_index - self.num_lines + 1)
 
     def copy(self):
         return Explorer(
@@ -595,6 +874,7 @@ class Explorer:
             cached_obj=self.cached_obj,
             filter=self.filter,
             stack=self.stack,
+            deep_search=self.deep_search,
             state=self.state,
             public_index=self.public_index,
             public_window=self.public_window,
@@ -607,6 +887,8 @@ class Explorer:
         )
 
     def reset_index(self):
+        if self.cached_obj.pending_filter:
+            return
         if self.public_index >= self.num_filtered_attributes:
             self.public_index = self.num_filtered_attributes - 1
             self.public_window = max(0, self.public_index - self.num_lines + 2)
@@ -635,6 +917,8 @@ class Explorer:
             return self.cached_obj.num_public_attributes
         elif self.state == ExplorerState.private:
             return self.cached_obj.num_private_attributes
+        elif self.state in (ExplorerState.items, ExplorerState.locals):
+            return self.num_filtered_attributes
         else:
             return self.cached_obj.length or 0
 
@@ -647,6 +931,10 @@ class Explorer:
             return self.cached_obj.num_filtered_private_attributes
         elif self.state == ExplorerState.dict:
             return self.cached_obj.num_filtered_dict_keys
+        elif self.state in (ExplorerState.items, ExplorerState.locals):
+            # The filters don't apply to these
+            view = self.peek_view
+            return len(view) if view is not None else 0
         else:
             return self.cached_obj.num_filtered_list_items
 
@@ -655,44 +943,83 @@ class Explorer:
         return self.num_attributes - self.num_filtered_attributes
 
     @property
-    def num_lines(self):
-        return self.term.height - 5
+    def num_filtered_line(self) -> Text:
+        """ The line under the rows telling how many of them are hidden by the filters """
+        line = (
+            Text("+", style=Style(color="white", dim=True, italic=True, underline=True))
+            + Text(
+                str(self.num_hidden_attributes),
+                style=Style(color="cyan", dim=True, italic=True),
+            )
+            + Text(
+                " filtered, searching…" if self.cached_obj.pending_filter else " filtered",
+                style=Style(color="white", dim=True, italic=True),
+            )
+        )
+        line.truncate(self.text_width)
+        return line
 
     @property
-    def live_update(self) -> bool:
-        """True/False value wheter to live update the filters of the cached object
-        If the number of visible attributes is over a threshold we do not live update
-        the search filter
-        """
-        return self.num_attributes < 130
+    def num_lines(self):
+        return self.term.height - 5
 
     @property
-    def selected_object(self) -> CachedObject:
-        """ Return the currently selected cached object """
+    def selected_row(self) -> Optional[ChildRow]:
+        """ The row of the selected attribute, None if there is none or a dict/list is explored """
         try:
             if self.state == ExplorerState.public:
-                attr = list(self.cached_obj.filtered_public_attributes.keys())[
-                    self.public_index
-                ]
+                attr = self.cached_obj.filtered_public_keys[self.public_index]
                 return self.cached_obj.filtered_public_attributes[attr]
 
             elif self.state == ExplorerState.private:
-                attr = list(self.cached_obj.filtered_private_attributes.keys())[
-                    self.private_index
-                ]
+                attr = self.cached_obj.filtered_private_keys[self.private_index]
                 return self.cached_obj.filtered_private_attributes[attr]
 
+        except (KeyError, IndexError):
+            pass
+        return None
+
+    @property
+    def selection_ready(self) -> bool:
+        """False while the selected attribute is still being read, or if reading it or importing the
+        selected submodule failed. Until then only its placeholder can be selected, and acting on
+        that would act on the placeholder instead of the attribute or module"""
+        row = self.selected_row
+        if row is None:
+            return True
+        # Imports the submodule, or gives an attribute that has not been read yet its moment to finish
+        row.resolve()
+        return type(row.obj) not in (UnevaluatedAttribute, UnimportedModule)
+
+    @property
+    def selected_object(self) -> CachedObject:
+        """ Return the currently selected cached object """
+        try:
+            if self.state in (ExplorerState.public, ExplorerState.private):
+                row = self.selected_row
+                if row is None:
+                    raise IndexError
+                return row.resolve()
+
             elif self.state == ExplorerState.dict:
-                # Get the currently selected key
-                key = list(self.cached_obj.filtered_dict)[self.dict_index]
-                return self.cached_obj.filtered_dict[key].cached_object
+                return self.cached_obj.filtered_dict.cached_object(self.dict_index)
 
             elif self.state in (
                 ExplorerState.list,
                 ExplorerState.tuple,
                 ExplorerState.set,
             ):
-                return self.cached_obj.filtered_list[self.list_index][1]
+                return self.cached_obj.filtered_list.cached_object(self.list_index)
+
+            elif self.state == ExplorerState.items:
+                return self.cached_obj.peeked_items.cached_object(self.list_index)
+
+            elif self.state == ExplorerState.locals:
+                view = self.cached_obj.peeked_items.frame_locals
+                if view is None:
+                    raise IndexError
+                return view.cached_object(self.dict_index)
+
             else:
                 raise ValueError("Unexpected explorer state")
 
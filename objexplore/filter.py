@@ -11,7 +11,7 @@ from rich.panel import Panel
 from rich.style import Style
 from rich.text import Text
 
-from .cached_object import CachedObject
+from .cached_object import CachedObject, TypeFlag
 from .config import box_type
 
 console = Console()
@@ -20,58 +20,6 @@ highlighter = ReprHighlighter()
 # TODO scroll search if input longer than panel width
 
 
-def isclass(cached_obj: CachedObject):
-    return cached_obj.isclass
-
-
-def isfunction(cached_obj: CachedObject):
-    return cached_obj.isfunction
-
-
-def ismethod(cached_obj: CachedObject):
-    return cached_obj.ismethod
-
-
-def ismodule(cached_obj: CachedObject):
-    return cached_obj.ismodule
-
-
-def isbuiltin(cached_obj: CachedObject):
-    return cached_obj.isbuiltin
-
-
-def isint(cached_obj: CachedObject):
-    return type(cached_obj.obj) == int
-
-
-def isstr(cached_obj: CachedObject):
-    return type(cached_obj.obj) == str
-
-
-def isfloat(cached_obj: CachedObject):
-    return type(cached_obj.obj) == float
-
-
-def isbool(cached_obj: CachedObject):
-    return type(cached_obj.obj) == bool
-
-
-def isdict(cached_obj: CachedObject):
-    return type(cached_obj.obj) == dict
-
-
-def islist(cached_obj: CachedObject):
-    return type(cached_obj.obj) == list
-
-
-def istuple(cached_obj: CachedObject):
-    return type(cached_obj.obj) == tuple
-
-
-def isset(cached_obj: CachedObject):
-    return type(cached_obj.obj) == set
-
-
 @rich.repr.auto
 class Filter:
     def __init__(self, term: Terminal):
@@ -79,23 +27,24 @@ class Filter:
         self.layout = Layout(visible=False)
 
         self.filters = {
-            "class": [False, isclass],
-            "function": [False, isfunction],
-            "method": [False, ismethod],
-            "module": [False, ismodule],
-            "int": [False, isint],
-            "str": [False, isstr],
-            "float": [False, isfloat],
-            "bool": [False, isbool],
-            "dict": [False, isdict],
-            "list": [False, islist],
-            "tuple": [False, istuple],
-            "set": [False, isset],
-            "builtin": [False, isbuiltin],
+            "class": [False, TypeFlag.CLASS],
+            "function": [False, TypeFlag.FUNCTION],
+            "method": [False, TypeFlag.METHOD],
+            "module": [False, TypeFlag.MODULE],
+            "int": [False, TypeFlag.INT],
+            "str": [False, TypeFlag.STR],
+            "float": [False, TypeFlag.FLOAT],
+            "bool": [False, TypeFlag.BOOL],
+            "dict": [False, TypeFlag.DICT],
+            "list": [False, TypeFlag.LIST],
+            "tuple": [False, TypeFlag.TUPLE],
+            "set": [False, TypeFlag.SET],
+            "builtin": [False, TypeFlag.BUILTIN],
         }
         self.index = 0
         self.receiving_input = False
         self.search_filter = ""
+        self.fuzzy_search = False
         self.cursor_pos = 0
         self.key_history: List[Keystroke] = []
 
@@ -113,12 +62,13 @@ class Filter:
     def move_bottom(self):
         self.index = len(self.filters) - 1
 
-    def get_enabled_filters(self) -> list:
-        return [
-            function
-            for name, (enabled, function) in self.filters.items()
-            if enabled is True
-        ]
+    def get_filter_mask(self) -> int:
+        """ Combine the `TypeFlag`s of the enabled filters """
+        mask = 0
+        for name, (enabled, flag) in self.filters.items():
+            if enabled is True:
+                mask |= flag
+        return mask
 
     @property
     def selected_filter(self):
@@ -129,18 +79,20 @@ class Filter:
         self.filters[self.selected_filter][0] = not self.filters[self.selected_filter][
             0
         ]
-        cached_obj.set_filters(self.get_enabled_filters(), self.search_filter)
+        cached_obj.set_filters(
+            self.get_filter_mask(), self.search_filter, self.fuzzy_search
+        )
 
     def clear_filters(self, cached_obj: CachedObject):
         for name, filter_data in self.filters.copy().items():
             self.filters[name][0] = False
         self.search_filter = ""
         self.cursor_pos = 0
-        cached_obj.set_filters([])
+        cached_obj.set_filters(0, fuzzy_search=self.fuzzy_search)
 
     def get_lines(self) -> List[Text]:
         lines = []
-        for index, (name, (enabled, method)) in enumerate(self.filters.items()):
+        for index, (name, (enabled, flag)) in enumerate(self.filters.items()):
             line = (
                 Text("[", style=Style(color="white"))
                 + Text("X" if enabled else " ", style=Style(color="blue"))
@@ -154,7 +106,10 @@ class Filter:
         if self.search_filter:
             lines.extend(
                 [
-                    Text("Search filter:", style=Style(italic=True, underline=True)),
+                    Text(
+                        "Fuzzy search filter:" if self.fuzzy_search else "Search filter:",
+                        style=Style(italic=True, underline=True),
+                    ),
                     Text(" " + self.search_filter),
                 ]
             )
@@ -165,7 +120,6 @@ class Filter:
         self,
         key: blessed.keyboard.Keystroke,
         cached_obj: CachedObject,
-        live_update: bool,
     ):
         self.key_history.append(key)
         self.search_filter = (
@@ -175,16 +129,14 @@ class Filter:
         )
         self.cursor_pos += 1
 
-        if live_update:
-            cached_obj.set_filters(self.get_enabled_filters(), self.search_filter)
+        cached_obj.set_filters(
+            self.get_filter_mask(), self.search_filter, self.fuzzy_search
+        )
 
-    def backspace(self, cached_obj: CachedObject, live_update: bool):
+    def backspace(self, cached_obj: CachedObject):
         """Delete the character before the cursor.
         Args:
             cached_obj: The current object being explored.
-            live_update: True/False value whether to update the cached_obj
-                filters. If there are too many attributes then updating the
-                filters will slow down.
         """
         if self.cursor_pos == 0 and self.search_filter == "":
             self.cancel_search(cached_obj)
@@ -198,15 +150,25 @@ class Filter:
         )
         self.cursor_left()
 
-        if live_update:
-            cached_obj.set_filters(self.get_enabled_filters(), self.search_filter)
+        cached_obj.set_filters(
+            self.get_filter_mask(), self.search_filter, self.fuzzy_search
+        )
 
     def cancel_search(self, cached_obj: CachedObject):
         self.search_filter = ""
         self.cursor_pos = 0
         self.layout.visible = False
         self.receiving_input = False
-        cached_obj.set_filters(self.get_enabled_filters(), self.search_filter)
+        cached_obj.set_filters(
+            self.get_filter_mask(), self.search_filter, self.fuzzy_search
+        )
+
+    def toggle_fuzzy_search(self, cached_obj: CachedObject):
+        """ Switch between matching the search as a substring and fuzzy matching it """
+        self.fuzzy_search = not self.fuzzy_search
+        cached_obj.set_filters(
+            self.get_filter_mask(), self.search_filter, self.fuzzy_search
+        )
 
     def cursor_left(self):
         if self.cursor_pos > 0:
@@ -220,7 +182,9 @@ class Filter:
         self.receiving_input = False
         self.layout.visible = False
         cached_obj.set_filters(
-            self.get_enabled_filters(), search_filter=self.search_filter
+            self.get_filter_mask(),
+            search_filter=self.search_filter,
+            fuzzy_search=self.fuzzy_search,
         )
 
     def get_layout(self, width: int) -> Layout:
@@ -275,9 +239,9 @@ class Filter:
         self.layout.update(
             Panel(
                 search_text,
-                title="\[search]",
+                title="\[fuzzy search]" if self.fuzzy_search else "\[search]",
                 title_align="right",
-                subtitle="[dim][u]esc[/u]:cancel",
+                subtitle="[dim][u]tab[/u]:fuzzy [u]esc[/u]:cancel",
                 subtitle_align="right",
                 style=Style(color="aquamarine1"),
                 box=box_type,
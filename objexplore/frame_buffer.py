@@ -0,0 +1,55 @@
+from typing import List, Optional, Tuple
+
+from blessed import Terminal
+from rich.console import COLOR_SYSTEMS, Console, RenderableType
+
+
+class FrameBuffer:
+    """The lines that are on the screen. Every frame is rendered to a list of lines, and only the
+    lines that differ from the previous frame are written to the terminal, in a single write,
+    instead of printing the whole screen again for every keystroke"""
+
+    def __init__(self, term: Terminal):
+        self.term = term
+        self.lines: List[str] = []
+        # The terminal size the lines were drawn for
+        self.size: Optional[Tuple[int, int]] = None
+
+    def invalidate(self):
+        """ Draw the whole screen on the next frame, e.g. after a pager was open """
+        self.lines = []
+        self.size = None
+
+    def render(self, console: Console, renderable: RenderableType) -> List[str]:
+        """ Render to one string, with its escape codes, per line of the screen """
+        color_system = (
+            COLOR_SYSTEMS[console.color_system] if console.color_system else None
+        )
+        return [
+            "".join(
+                segment.style.render(segment.text, color_system=color_system)
+                if segment.style
+                else segment.text
+                for segment in line
+            )
+            for line in console.render_lines(renderable, pad=True)
+        ]
+
+    def draw(self, lines: List[str]):
+        output = []
+        size = (self.term.width, self.term.height)
+        if size != self.size:
+            # Everything moves around when the terminal is resized
+            output.append(self.term.home + self.term.clear)
+            self.lines = []
+
+        for y, line in enumerate(lines):
+            if y >= len(self.lines) or line != self.lines[y]:
+                output.append(self.term.move_yx(y, 0) + line)
+        for y in range(len(lines), len(self.lines)):
+            output.append(self.term.move_yx(y, 0) + self.term.clear_eol)
+
+        self.lines = lines
+        self.size = size
+        if output:
+            print("".join(output), end="", flush=True)
@@ -48,15 +48,18 @@ class HelpLayout(Layout):
                       j ↓ - [cyan]down[/cyan]
                         g - [cyan]go to top[/cyan]
                         G - [cyan]go to bottom[/cyan]
+                        : - [cyan]go to index (lists, tuples, sets and dicts)[/cyan]
                 l → Enter - [cyan]select[/cyan]
                     Space - [cyan]select[/cyan]
                       h ← - [cyan]go back to parent object[/cyan]
-                      [ ] - [cyan]switch attribute type (public/private)[/cyan]
+                      [ ] - [cyan]switch attribute type (public/private/iterator items/generator locals)[/cyan]
                       { } - [cyan]switch pane[/cyan]
                         p - [cyan]toggle full preview[/cyan]
                         d - [cyan]toggle full docstring[/cyan]
                         n - [cyan]toggle filter view[/cyan]
                         / - [cyan]open search filter[/cyan]
+                      Tab - [cyan]toggle fuzzy search (while searching)[/cyan]
+                        D - [cyan]deep search everything reachable from the object[/cyan]
                       Esc - [cyan]close[/cyan]
                         c - [cyan]clear filters[/cyan]
                         o - [cyan]toggle stack view[/cyan]
@@ -66,6 +69,7 @@ class HelpLayout(Layout):
                         = - [cyan]return explorer layout size to default[/cyan]
                         O - [cyan]open source file in [i u]$EDITOR[/i u][/cyan]
                         H - [cyan]open help page on selected attribute[/cyan]
+                        L - [cyan]compute [magenta]len[/magenta]() of the selected object when it could be slow[/cyan]
                         i - [cyan]run [magenta]rich[/magenta][white].[/white][magenta]inspect[/magenta][white](<[/white][bright_magenta]OBJECT[/bright_magenta]>, [yellow]methods[/yellow]=[italic bright_green]True[/italic bright_green][white])[/white][/cyan]
                         I - [cyan]run [magenta]rich[/magenta][white].[/white][magenta]inspect[/magenta][white](<[/white][bright_magenta]OBJECT[/bright_magenta]>, [yellow]all[/yellow]=[italic bright_green]True[/italic bright_green][white])[/white][/cyan]
                         r - [cyan]return the selected object[/cyan]
@@ -0,0 +1,41 @@
+from concurrent.futures import Future
+from typing import List, Optional
+
+from .cached_object import CachedObject, ChildRow
+from .worker import LOW_PRIORITY, worker_pool
+
+
+class SubmoduleImporter:
+    """Import the placeholder submodules of the explored module in the background, see
+    `cached_object.UnimportedModule`. Every submodule is its own low priority job, so prefetching
+    doesn't have to wait for a whole package to be imported"""
+
+    def __init__(self):
+        self.cached_obj: Optional[CachedObject] = None
+        self.futures: List[Future] = []
+
+    def import_submodules(self, cached_obj: CachedObject):
+        if cached_obj is self.cached_obj:
+            return
+
+        self.cancel()
+        self.cached_obj = cached_obj
+        for rows in (cached_obj.public_attributes, cached_obj.private_attributes):
+            for row in rows.values():
+                if row.is_placeholder:
+                    self.futures.append(
+                        worker_pool.submit(self.import_row, row, priority=LOW_PRIORITY)
+                    )
+
+    @staticmethod
+    def import_row(row: ChildRow):
+        # The row may have been selected and imported since the job was submitted
+        if row.is_placeholder:
+            row.import_module()
+
+    def cancel(self):
+        """ Drop the imports that have not started yet """
+        for future in self.futures:
+            future.cancel()
+        self.cached_obj = None
+        self.futures = []
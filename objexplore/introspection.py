@@ -0,0 +1,366 @@
+from collections import OrderedDict
+from functools import partial
+import inspect
+import threading
+from types import CodeType, FrameType, FunctionType, MethodType, ModuleType, TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+import weakref
+
+from rich.console import Console
+from rich.highlighter import ReprHighlighter
+from rich.text import Text
+
+from .config import (
+    cheap_len_types,
+    introspection_cache_max_bytes,
+    introspection_cache_max_entries,
+)
+from .persistent_cache import cached_on_disk
+from .utils import lazy_property
+
+console = Console()
+highlighter = ReprHighlighter()
+
+T = TypeVar("T")
+
+# Rough size in bytes of an entry before anything is stored in it
+ENTRY_OVERHEAD = 500
+
+
+def estimate_size(value: Any) -> int:
+    """ Very rough estimate of the memory used by a cached value """
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, Text):
+        return 2 * len(value.plain)
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(item) + 8 for item in value)
+    return 100
+
+
+def list_attrs(obj: Any) -> List[str]:
+    plain_attrs = dir(obj)
+
+    if "__weakref__" in plain_attrs:
+        # Ignore weakrefs
+        # Why??? I don't remember
+        plain_attrs.remove("__weakref__")
+
+    return plain_attrs
+
+
+def stored_attrs(obj: Any, stamp: Optional[int]) -> List[str]:
+    """ `list_attrs`, through the persistent cache if it is enabled """
+    return cached_on_disk(obj, "attrs", partial(list_attrs, obj), stamp)
+
+
+def attrs_stamp(obj: Any) -> Optional[int]:
+    """Cheap check for whether the attributes of an object have changed since they were cached.
+    Catches attributes being added or removed from `__dict__`, which is the usual way they change"""
+    try:
+        return len(vars(obj))
+    except Exception:
+        return None
+
+
+class Introspection:
+    """The facts about one object that don't depend on the path it was reached by, like its
+    attributes, docstring and source. They are shared by every `CachedObject` of the object, so
+    the rich `Text` stored here must be copied before it is changed"""
+
+    def __init__(self, key: int, ref: Callable[[], Any], cache: "IntrospectionCache"):
+        self.key = key
+        # Returns the object while it is alive, see `IntrospectionCache.lookup`
+        self.ref = ref
+        self.cache = cache
+        self.nbytes = ENTRY_OVERHEAD
+        self.values: Dict[str, Tuple[Any, Any]] = {}
+
+    def get(self, name: str, compute: Callable[[], T], stamp: Any = None) -> T:
+        """Return the stored value called `name`, or compute and store it. A value stored with a
+        different `stamp` is out of date and computed again"""
+        stored = self.values.get(name)
+        if stored is not None and stored[0] == stamp:
+            return stored[1]
+
+        value = compute()
+        self.values[name] = (stamp, value)
+        self.cache.grow(self, estimate_size(value))
+        return value
+
+
+class IntrospectionCache:
+    """Process wide cache of `Introspection`s keyed by object identity, so an object that is
+    reached by two paths (e.g. a class via a package and via the module that defines it) or
+    explored again after going back up is only introspected once.
+
+    Objects that support weak references are checked with one, and their entry is dropped when
+    they are garbage collected. Other objects are kept alive by their entry so their id can't be
+    reused. The least recently used entries are evicted once the budget is used up"""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.entries: "OrderedDict[int, Introspection]" = OrderedDict()
+        # Reentrant because a weakref callback can run while the lock is held
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup(self, obj: Any) -> Introspection:
+        key = id(obj)
+        with self.lock:
+            introspection = self.entries.get(key)
+            if introspection is not None and introspection.ref() is obj:
+                self.entries.move_to_end(key)
+                return introspection
+
+            try:
+                ref: Callable[[], Any] = weakref.ref(obj, partial(self.discard, key))
+            except TypeError:
+                ref = StrongRef(obj)
+
+            introspection = Introspection(key, ref, self)
+            self.remove(key)
+            self.entries[key] = introspection
+            self.nbytes += introspection.nbytes
+            self.evict()
+            return introspection
+
+    def grow(self, introspection: Introspection, nbytes: int):
+        """ Account for a value being stored in an entry """
+        with self.lock:
+            introspection.nbytes += nbytes
+            if self.entries.get(introspection.key) is introspection:
+                self.nbytes += nbytes
+                self.evict()
+
+    def discard(self, key: int, ref: Any = None):
+        """ Remove the entry of an object that was garbage collected, unless its id was reused already """
+        with self.lock:
+            introspection = self.entries.get(key)
+            if introspection is not None and introspection.ref() is None:
+                self.remove(key)
+
+    def remove(self, key: int):
+        introspection = self.entries.pop(key, None)
+        if introspection is not None:
+            self.nbytes -= introspection.nbytes
+
+    def evict(self):
+        # Never evict the most recent entry, it is about to be used
+        while len(self.entries) > 1 and (
+            len(self.entries) > self.max_entries or self.nbytes > self.max_bytes
+        ):
+            _, introspection = self.entries.popitem(last=False)
+            self.nbytes -= introspection.nbytes
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+
+
+class StrongRef:
+    """ Stand-in for a weak reference to an object that doesn't support them """
+
+    def __init__(self, obj: Any):
+        self.obj = obj
+
+    def __call__(self) -> Any:
+        return self.obj
+
+
+introspection_cache = IntrospectionCache(
+    introspection_cache_max_entries, introspection_cache_max_bytes
+)
+
+
+class TypeFacts:
+    """The facts about the instances of a type that only depend on the type. They are worked out
+    once per type and shared by every instance, so a list of thousands of instances of the same
+    class doesn't call `dir()`, `inspect.getdoc()`, etc on every one of them, see `get_type_facts`"""
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        # See `class_attr_runs_code`
+        self.class_attrs_run_code: Dict[str, Optional[Tuple[bool, bool]]] = {}
+        self.class_access_runs_code: Dict[str, bool] = {}
+
+    @lazy_property
+    def plain_instances(self) -> bool:
+        """Whether `dir()`, the docstring and the source of an instance only depend on the type and the
+        instance's `__dict__`. Not the case for classes, modules or types that customize attribute
+        access"""
+        cls = self.cls
+        try:
+            return (
+                cls.__getattribute__ is object.__getattribute__
+                and cls.__dir__ is object.__dir__
+                and not hasattr(cls, "__getattr__")
+                # Not even `type(obj)` can be trusted if the class lies about `__class__`
+                and not any("__class__" in vars(base) for base in cls.__mro__[:-1])
+            )
+        except Exception:
+            return False
+
+    @lazy_property
+    def typeof(self) -> Text:
+        return highlighter(str(self.cls))
+
+    @lazy_property
+    def ismethoddescriptor(self) -> bool:
+        """ Same as `inspect.ismethoddescriptor` for any instance of the type """
+        if issubclass(self.cls, (type, MethodType, FunctionType)):
+            return False
+        return hasattr(self.cls, "__get__") and not hasattr(self.cls, "__set__")
+
+    @lazy_property
+    def sourceable(self) -> bool:
+        """ Whether `inspect.getsource()` could find the source of an instance """
+        return issubclass(
+            self.cls,
+            (ModuleType, type, MethodType, FunctionType, TracebackType, FrameType, CodeType),
+        ) or hasattr(self.cls, "__wrapped__")
+
+    @lazy_property
+    def docstring(self) -> Optional[Text]:
+        """The docstring of every instance that doesn't set its own `__doc__`, or None if the
+        instances can have different docstrings"""
+        if not self.plain_instances or hasattr(self.cls, "__get__"):
+            # `inspect.getdoc()` looks up the docstrings of descriptors by their name
+            return None
+        for base in self.cls.__mro__:
+            if "__doc__" in vars(base):
+                doc = vars(base)["__doc__"]
+                break
+        else:
+            doc = None
+        if doc is not None and not isinstance(doc, str):
+            # e.g. a property that gives each instance its own docstring
+            return None
+        return console.render_str(inspect.cleandoc(doc) if doc else "None")
+
+    @lazy_property
+    def len_is_cheap(self) -> bool:
+        """Whether `len()` of an instance can be called without being asked to. A `__len__` written
+        in C (builtin containers, numpy arrays, ...) only reads a size, one written in Python could
+        do anything unless the type is in `cheap_len_types`. Set to True once `len()` of an instance
+        turns out to be fast, see `CachedObject.measure_length`"""
+        for base in self.cls.__mro__:
+            if "__len__" in vars(base):
+                if not isinstance(vars(base)["__len__"], FunctionType):
+                    return True
+                return f"{base.__module__}.{base.__qualname__}" in cheap_len_types
+        return True
+
+    @lazy_property
+    def custom_getattribute(self) -> bool:
+        """ Whether every attribute access goes through a `__getattribute__` written in Python """
+        return isinstance(getattr(self.cls, "__getattribute__", None), FunctionType)
+
+    def class_attr_runs_code(self, name: str) -> Optional[Tuple[bool, bool]]:
+        """Whether reading the attribute `name` that an instance gets from the type runs code that
+        could be slow, along with whether it is a data descriptor. That is the case for properties,
+        for data descriptors that are not builtin (e.g. an ORM column that loads from the database)
+        and for other descriptors that are not builtin unless they are callable (those are usually
+        decorated methods, e.g. `functools.lru_cache`, while `functools.cached_property` is not).
+        None if the type has no such attribute"""
+        if name not in self.class_attrs_run_code:
+            result = None
+            for base in self.cls.__mro__:
+                if name in vars(base):
+                    value = vars(base)[name]
+                    value_type = type(value)
+                    is_data = hasattr(value_type, "__set__") or hasattr(
+                        value_type, "__delete__"
+                    )
+                    runs_code = isinstance(value, property) or (
+                        hasattr(value_type, "__get__")
+                        and value_type.__module__ != "builtins"
+                        and (is_data or not callable(value))
+                    )
+                    result = (runs_code, is_data)
+                    break
+            self.class_attrs_run_code[name] = result
+        return self.class_attrs_run_code[name]
+
+    def attr_runs_code(self, name: str, instance_dict: Dict[str, Any]) -> bool:
+        """Whether reading the attribute `name` of an instance runs code that could be slow, found
+        without running any of it, like `inspect.getattr_static` does. See `class_attr_runs_code`,
+        attributes that are not found at all come from `__getattr__`, which could do anything"""
+        if self.custom_getattribute:
+            return True
+        found = self.class_attr_runs_code(name)
+        if found is None:
+            return name not in instance_dict
+        runs_code, is_data = found
+        # Data descriptors win over the instance's `__dict__`, anything else is shadowed by it
+        return runs_code and (is_data or name not in instance_dict)
+
+    def attr_of_class_runs_code(self, name: str) -> bool:
+        """Whether reading the attribute `name` of the class itself, rather than of an instance, runs
+        code that could be slow. The metaclass plays the part of the type, so its properties run
+        code. Descriptors found on the class are called with `__get__(None, cls)`. Properties and
+        builtin descriptors return themselves then, but any other descriptor could do anything"""
+        if name not in self.class_access_runs_code:
+            metaclass_facts = get_type_facts(type(self.cls))
+            on_metaclass = metaclass_facts.class_attr_runs_code(name)
+            if metaclass_facts.custom_getattribute:
+                runs_code = True
+            elif on_metaclass is not None and on_metaclass[1]:
+                # Data descriptors of the metaclass win over the class's own attributes
+                runs_code = on_metaclass[0]
+            else:
+                for base in self.cls.__mro__:
+                    if name in vars(base):
+                        value = vars(base)[name]
+                        value_type = type(value)
+                        is_data = hasattr(value_type, "__set__") or hasattr(
+                            value_type, "__delete__"
+                        )
+                        runs_code = (
+                            hasattr(value_type, "__get__")
+                            and value_type.__module__ != "builtins"
+                            and (is_data or not callable(value))
+                        )
+                        break
+                else:
+                    # From the metaclass, or its `__getattr__` if it isn't found there either
+                    runs_code = on_metaclass[0] if on_metaclass is not None else True
+            self.class_access_runs_code[name] = runs_code
+        return self.class_access_runs_code[name]
+
+    def instance_attrs(self, obj: Any) -> List[str]:
+        """The same as `dir(obj)` for a plain instance, but the attributes of the class are only
+        listed once, only the keys of the instance's `__dict__` are looked at for every instance"""
+        class_attrs = introspection_cache.lookup(self.cls).get(
+            "plain_attrs",
+            partial(stored_attrs, self.cls, attrs_stamp(self.cls)),
+            stamp=attrs_stamp(self.cls),
+        )
+        try:
+            instance_keys = vars(obj)
+        except TypeError:
+            return class_attrs
+        if not instance_keys:
+            return class_attrs
+        try:
+            return sorted(set(class_attrs).union(instance_keys))
+        except TypeError:
+            # Keys that are not strings can't be sorted along with the others
+            return list_attrs(obj)
+
+
+# Types live as long as the program in most cases, so unlike `introspection_cache` they are looked up
+# in a plain dict, which is a lot faster than a weak one
+type_facts: Dict[type, TypeFacts] = {}
+
+
+def get_type_facts(cls: type) -> TypeFacts:
+    facts = type_facts.get(cls)
+    if facts is None:
+        facts = type_facts[cls] = TypeFacts(cls)
+    return facts
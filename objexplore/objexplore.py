@@ -17,10 +17,19 @@ from rich.syntax import Syntax
 from rich.text import Text
 
 from .cached_object import CachedObject
-from .explorer import Explorer, ExplorerState
+from .explorer import Explorer
+from .frame_buffer import FrameBuffer
 from .help_layout import HelpState, random_error_quote
 from .overview import Overview, OverviewState, PreviewState
-from .config import box_type
+from .importer import SubmoduleImporter
+from .persistent_cache import enable_persistent_cache, save_persistent_cache
+from .prefetch import Prefetcher
+from .config import (
+    background_time_slice,
+    box_type,
+    import_submodules_in_background,
+    max_frame_rate,
+)
 
 # TODO object highlighted on stack view should be shown on the overview
 # TODO support ctrl-a + (whatever emacs keybinding to go to end of line)
@@ -47,6 +56,9 @@ class ObjExploreApp:
 
         self.explorer = Explorer(term=self.term, cached_obj=cached_obj)
         self.overview = Overview(term=self.term, version=version)
+        self.prefetcher = Prefetcher()
+        self.importer = SubmoduleImporter()
+        self.frame_buffer = FrameBuffer(term=self.term)
 
         # Run self.draw() whenever the win change signal is caught
         try:
@@ -60,6 +72,8 @@ class ObjExploreApp:
 
         key = None
         res = None
+        # Wait at least this long between frames, see `max_frame_rate`
+        frame_time = 1 / max_frame_rate if max_frame_rate else 0
 
         # Clear the screen
         print(self.term.clear, end="")
@@ -68,9 +82,34 @@ class ObjExploreApp:
             while True:
                 try:
                     self.draw()
-                    key = self.term.inkey()
+                    last_draw = time.perf_counter()
+
+                    if self.pending_work:
+                        # Keep working in between frames, but a new keystroke always goes first
+                        key = self.term.inkey(timeout=0)
+                        if not key:
+                            self.run_pending_work()
+                            continue
+                    else:
+                        # Nothing left to do until the next keystroke, use the time to cache the
+                        # attributes of the highlighted object in case it is explored next
+                        self.prefetcher.prefetch(self.explorer.selected_object)
+                        if import_submodules_in_background:
+                            self.importer.import_submodules(self.explorer.cached_obj)
+                        key = self.term.inkey()
+
                     self.process_key_event(key)
 
+                    # Apply every key that is already waiting (e.g. from holding down a key) and any
+                    # that arrives before the next frame is due, then draw them all at once
+                    while True:
+                        key = self.term.inkey(
+                            timeout=max(0, last_draw + frame_time - time.perf_counter())
+                        )
+                        if not key:
+                            break
+                        self.process_key_event(key)
+
                 except RuntimeError as err:
                     # Some kind of error thrown during resizing events. Ignore and continue
                     if (
@@ -86,20 +125,52 @@ class ObjExploreApp:
                         res = self.explorer.selected_object.obj
                     break
 
+        self.prefetcher.cancel()
+        self.importer.cancel()
+        self.overview.render_cache.cancel()
+        save_persistent_cache()
+
         # Unhide the cursor
         print("\x1b[?25h", end="")
 
         return res
 
+    @property
+    def pending_work(self) -> bool:
+        """Whether there is any filtering, searching, rendering or reading of the selected attribute
+        that has not finished yet"""
+        selected_row = self.explorer.selected_row
+        return bool(
+            self.explorer.cached_obj.pending_filter
+            or self.explorer.deep_search.pending_search
+            or (
+                self.overview.render_cache.pending
+                and not self.overview.render_cache.is_hung
+            )
+            # An attribute that seems to hang is only checked on again when the explorer is redrawn
+            or (
+                selected_row is not None
+                and selected_row.is_evaluating
+                and not selected_row.is_hung
+            )
+        )
+
+    def run_pending_work(self):
+        """Continue any filtering, searching, rendering or reading of the selected attribute that has
+        not finished yet"""
+        self.explorer.cached_obj.run_pending_filter(background_time_slice)
+        self.explorer.deep_search.run_pending_search(background_time_slice)
+        self.overview.render_cache.wait(background_time_slice)
+        selected_row = self.explorer.selected_row
+        if selected_row is not None and selected_row.is_evaluating:
+            selected_row.evaluate(background_time_slice)
+
     def process_key_event(self, key: Keystroke) -> Any:
         """ Process the incoming key """
 
         if self.explorer.filter.receiving_input:
             if key.code == self.term.KEY_BACKSPACE:
-                self.explorer.filter.backspace(
-                    cached_obj=self.explorer.cached_obj,
-                    live_update=self.explorer.live_update,
-                )
+                self.explorer.filter.backspace(cached_obj=self.explorer.cached_obj)
             elif key.code == self.term.KEY_ESCAPE:
                 self.explorer.filter.cancel_search(self.explorer.cached_obj)
             elif key.code == self.term.KEY_ENTER:
@@ -108,16 +179,47 @@ class ObjExploreApp:
                 self.explorer.filter.cursor_left()
             elif key.code == self.term.KEY_RIGHT:
                 self.explorer.filter.cursor_right()
+            elif key.code == self.term.KEY_TAB:
+                self.explorer.filter.toggle_fuzzy_search(self.explorer.cached_obj)
             elif key.code in (self.term.KEY_UP, self.term.KEY_DOWN):
                 return
             else:
                 self.explorer.filter.add_search_char(
-                    key=key,
-                    cached_obj=self.explorer.cached_obj,
-                    live_update=self.explorer.live_update,
+                    key=key, cached_obj=self.explorer.cached_obj
                 )
             return
 
+        if self.explorer.deep_search.receiving_input:
+            if key.code == self.term.KEY_BACKSPACE:
+                self.explorer.deep_search.backspace()
+            elif key.code == self.term.KEY_ESCAPE:
+                self.explorer.deep_search.cancel()
+            elif key.code == self.term.KEY_ENTER:
+                self.explorer.deep_search.start(self.explorer.cached_obj)
+            elif not key.is_sequence:
+                self.explorer.deep_search.add_search_char(str(key))
+            return
+
+        if self.explorer.index_input is not None:
+            if key.code == self.term.KEY_BACKSPACE and self.explorer.index_input:
+                self.explorer.index_input = self.explorer.index_input[:-1]
+            elif key.code in (self.term.KEY_BACKSPACE, self.term.KEY_ESCAPE):
+                self.explorer.index_input = None
+            elif key.code == self.term.KEY_ENTER:
+                if self.explorer.index_input and not self.explorer.go_to_index(
+                    int(self.explorer.index_input)
+                ):
+                    self.error()
+                self.explorer.index_input = None
+            elif key.isdigit():
+                self.explorer.index_input += key
+            return
+
+        # Don't return the placeholder of an attribute that is still being read
+        if key == "r" and not self.explorer.selection_ready:
+            self.error()
+            return
+
         if key in ("q", "Q", "r"):
             raise StopIteration
 
@@ -138,6 +240,7 @@ class ObjExploreApp:
                     console.print(self.overview.help_layout.text)
                 str_out = capture.get()
                 pydoc.pager(str_out)
+                self.frame_buffer.invalidate()
                 return
 
             # Switch panes
@@ -162,6 +265,40 @@ class ObjExploreApp:
             self.overview.help_layout.visible = True
             return
 
+        # Deep search #########################################################
+
+        if key == "D":
+            self.explorer.filter.layout.visible = False
+            self.explorer.stack.layout.visible = False
+            self.explorer.deep_search.open_input()
+            return
+
+        if self.explorer.deep_search.layout.visible:
+            if key.code in (self.term.KEY_BACKSPACE, self.term.KEY_ESCAPE):
+                self.explorer.deep_search.cancel()
+                return
+            elif key in (" ", "l") or key.code in (
+                self.term.KEY_ENTER,
+                self.term.KEY_RIGHT,
+            ):
+                self.explorer.explore_deep_search_result()
+                return
+            elif key == "j" or key.code == self.term.KEY_DOWN:
+                self.explorer.deep_search.move_down()
+                return
+            elif key == "k" or key.code == self.term.KEY_UP:
+                self.explorer.deep_search.move_up()
+                return
+            elif key == "g":
+                self.explorer.deep_search.move_top()
+                return
+            elif key == "G":
+                self.explorer.deep_search.move_bottom()
+                return
+            elif key in ("o", "s", "n", "/"):
+                # Close the deep search and open the other panel
+                self.explorer.deep_search.cancel()
+
         # Stack ###############################################################
 
         if key == "o" or key == "s":
@@ -261,19 +398,18 @@ class ObjExploreApp:
             self.explorer.move_down()
 
         elif key.code == self.term.KEY_PGUP:
-            for i in range(self.term.height - 5):
-                self.explorer.move_up()
+            self.explorer.move_up(self.explorer.num_lines)
 
         elif key.code == self.term.KEY_PGDOWN:
-            for i in range(self.term.height - 5):
-                self.explorer.move_down()
+            self.explorer.move_down(self.explorer.num_lines)
 
         elif key in ("l") or key.code in (
             self.term.KEY_ENTER,
             self.term.KEY_RIGHT,
             self.term.KEY,
         ):
-            self.explorer.explore_selected_object()
+            if self.explorer.explore_selected_object() is None:
+                self.error()
 
         # Go back to parent
         elif (
@@ -293,13 +429,9 @@ class ObjExploreApp:
         ):
             self.explorer.move_bottom()
 
-        # Switch between public and private attributes
+        # Switch between public and private attributes, and the items and locals of iterators
         elif key in ("[", "]"):
-            if self.explorer.state == ExplorerState.public:
-                self.explorer.state = ExplorerState.private
-
-            elif self.explorer.state == ExplorerState.private:
-                self.explorer.state = ExplorerState.public
+            self.explorer.switch_pane(-1 if key == "[" else 1)
 
         elif key == "+":
             self.explorer.increase_width()
@@ -337,6 +469,11 @@ class ObjExploreApp:
                 else OverviewState.all
             )
 
+        # The rest act on the selected object, which can't be the placeholder of an attribute
+        # that is still being read
+        elif key in ("f", "O", "L", "H", "i", "I") and not self.explorer.selection_ready:
+            self.error()
+
         # Fullscreen
         elif key == "f":
             printable: Union[str, Syntax, Text]
@@ -360,18 +497,32 @@ class ObjExploreApp:
                 console.print(printable)
             str_out = capture.get()
             pydoc.pager(str_out)
+            self.frame_buffer.invalidate()
 
         elif key == "O":
             try:
                 path = inspect.getabsfile(self.explorer.selected_object.obj)
                 subprocess.call([EDITOR, path])  # type: ignore
+                self.frame_buffer.invalidate()
                 # Re-hide the cursor
                 print("\x1b[?25l", end="")
             except Exception:
                 self.error()
 
+        elif key == ":":
+            if not self.explorer.open_index_input():
+                self.error()
+
+        elif key == "L":
+            # Compute `len()` of the selected object, even if it could be slow
+            cached_obj = self.explorer.selected_object
+            cached_obj.measure_length()
+            if cached_obj.length is None:
+                self.error()
+
         elif key == "H":
             help(self.explorer.selected_object.obj)
+            self.frame_buffer.invalidate()
 
         elif key == "i":
             with console.capture() as capture:
@@ -382,6 +533,7 @@ class ObjExploreApp:
                 )
             str_out = capture.get()
             pydoc.pager(str_out)
+            self.frame_buffer.invalidate()
 
         elif key == "I":
             with console.capture() as capture:
@@ -390,10 +542,10 @@ class ObjExploreApp:
                 )
             str_out = capture.get()
             pydoc.pager(str_out)
+            self.frame_buffer.invalidate()
 
     def draw(self, *_):
         """ Draw the application. the *_ argument is due to resize events and are unused """
-        print(self.term.home, end="")
         layout = Layout()
         layout.split_row(
             self.explorer.get_layout(),
@@ -419,7 +571,9 @@ class ObjExploreApp:
             style=self.main_style,
             box=box_type,
         )
-        rich.print(object_explorer, end="")
+        self.frame_buffer.draw(
+            self.frame_buffer.render(rich.get_console(), object_explorer)
+        )
 
     def error(self):
         """ Color the outside red and pause for a split second """
@@ -429,10 +583,14 @@ class ObjExploreApp:
         self.main_style = self.main_style
 
 
-def explore(obj: Any) -> Any:
+def explore(obj: Any, persistent_cache: Optional[bool] = None) -> Any:
     """
     Run the explorer on the given object
 
+    `persistent_cache` turns the cache of introspection results on disk on or off for this
+    session, by default it follows the OBJEXPLORE_PERSISTENT_CACHE environment variable and then
+    `config.persistent_cache_enabled`, see `persistent_cache.enable_persistent_cache`
+
     Get the name of the variable sent to this function
     If someone calls this function like:
     >>> df = pandas.DataFrame()
@@ -452,6 +610,8 @@ def explore(obj: Any) -> Any:
     I dont know of any way to fix this
     """
 
+    enable_persistent_cache(persistent_cache)
+
     frame = inspect.currentframe()
     name = frame.f_back.f_code.co_names[1]  # type: ignore
     app = ObjExploreApp(obj, name=name)
@@ -1,18 +1,64 @@
-from typing import Union
+from functools import partial
+from typing import Any, Hashable, Optional, Union
 
 from blessed import Terminal
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.highlighter import ReprHighlighter
 from rich.layout import Layout
 from rich.panel import Panel
-from rich.pretty import Pretty
+from rich.pretty import pretty_repr
 from rich.style import Style
 from rich.syntax import Syntax
 from rich.text import Text
 
-from .cached_object import CachedObject
+from .cached_object import CachedObject, placeholder_failed
 from .help_layout import HelpLayout
+from .render_cache import RenderCache
 from .config import box_type
 
 
+highlighter = ReprHighlighter()
+
+# Characters of each line of the preview that are highlighted
+HIGHLIGHT_MAX_CHARS = 500
+
+
+class PreviewRepr:
+    """The repr shown in the preview, laid out like rich's `Pretty`. Long strings and containers
+    are cut short, and the text is cut down to what fits on the screen before it is highlighted,
+    a custom `__repr__` can return megabytes. Drawing it costs the same however big the object is"""
+
+    def __init__(self, obj: Any, max_lines: int, max_length: Optional[int] = None):
+        self.obj = obj
+        self.max_lines = max_lines
+        self.max_length = max_length
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        max_lines = min(options.height or self.max_lines, self.max_lines)
+        max_chars = options.max_width * max_lines
+        text = pretty_repr(
+            self.obj,
+            max_width=options.max_width,
+            max_length=self.max_length,
+            max_string=max_chars,
+            max_depth=max_lines,
+        )
+        lines = text[:max_chars].split("\n")[:max_lines]
+        if not text:
+            yield Text(f"{type(self.obj)}.__repr__ returned empty string", style="dim italic")
+            return
+
+        # Some of the highlighter's patterns take quadratic time on a long run of characters, so
+        # only the start of a long line is highlighted
+        rendered = Text(style="pretty")
+        for number, line in enumerate(lines):
+            if number:
+                rendered.append("\n")
+            rendered.append_text(highlighter(Text.from_ansi(line[:HIGHLIGHT_MAX_CHARS])))
+            rendered.append(line[HIGHLIGHT_MAX_CHARS:])
+        yield rendered
+
+
 class OverviewState:
     all, docstring, value = range(3)
 
@@ -28,6 +74,7 @@ class Overview:
         self.help_layout = HelpLayout(version, visible=False, ratio=3)
         self.state = OverviewState.all
         self.preview_state = PreviewState.repr
+        self.render_cache = RenderCache()
 
     @property
     def layout_width(self):
@@ -40,23 +87,48 @@ class Overview:
         if self.help_layout.visible:
             return self.help_layout(self.term.height)
 
-        elif self.state == OverviewState.docstring:
-            self.layout.update(
-                self.get_docstring_panel(
-                    cached_obj=cached_obj,
-                    term_height=self.term.height,
-                )
+        # Moving the cursor around doesn't change the overview of an object, so it is only
+        # rendered again when the selected object, the state or the terminal size changes. It is
+        # rendered in the background, a huge value can take a while
+        self.layout.update(
+            self.render_cache.get(
+                self.render_key(cached_obj),
+                cached_obj.obj,
+                partial(self.build_overview, cached_obj),
+                placeholder=partial(self.build_overview, cached_obj, preview=False),
+            )
+        )
+        return self.layout
+
+    def render_key(self, cached_obj: CachedObject) -> Hashable:
+        """The key of the rendered overview in the render cache. A placeholder for a submodule or
+        attribute is the same object before and after loading it fails, but its repr changes"""
+        return (
+            id(cached_obj.obj),
+            cached_obj.length,
+            placeholder_failed(cached_obj.obj),
+            self.state,
+            self.preview_state,
+            self.term.height,
+        )
+
+    def build_overview(
+        self, cached_obj: CachedObject, preview: bool = True
+    ) -> RenderableType:
+        """ Build the overview, with a placeholder instead of the preview if `preview` is False """
+        if self.state == OverviewState.docstring:
+            return self.get_docstring_panel(
+                cached_obj=cached_obj,
+                term_height=self.term.height,
             )
-            return self.layout
 
         elif self.state == OverviewState.value:
-            self.layout.update(self.get_value_panel(cached_obj))
-            return self.layout
+            return self.get_value_panel(cached_obj, preview)
 
         elif self.state == OverviewState.all:
             layout = Layout()
             layout.split_column(
-                Layout(self.get_value_panel(cached_obj)),
+                Layout(self.get_value_panel(cached_obj, preview)),
                 self.get_info_layout(cached_obj),
                 Layout(
                     self.get_docstring_panel(
@@ -68,21 +140,25 @@ class Overview:
         else:
             raise ValueError("Unexpected overview state")
 
-    def get_value_panel(self, cached_obj: CachedObject):
-        renderable: Union[str, Pretty, Syntax]
-        if not callable(cached_obj.obj):
-            title = "[i]preview[/i] | [i][cyan]repr[/cyan]()[/i]"
+    def get_value_panel(self, cached_obj: CachedObject, preview: bool = True):
+        renderable: Union[str, PreviewRepr, Syntax]
+        if not preview:
+            title = "[i]preview[/i]"
             subtitle = "[dim][u]p[/u]:toggle [u]f[/u]:fullscreen [u]{}[/u]:switch pane"
-            renderable = cached_obj.pretty
+            renderable = "[dim italic]Rendering…"
 
+        elif not callable(cached_obj.obj):
+            title = "[i]preview[/i] | [i][cyan]repr[/cyan]()[/i]"
+            subtitle = "[dim][u]p[/u]:toggle [u]f[/u]:fullscreen [u]{}[/u]:switch pane"
             if self.state == OverviewState.all:
-                renderable.max_length = max((self.term.height - 6) // 2 - 7, 1)
+                max_length = max((self.term.height - 6) // 2 - 7, 1)
             else:
-                renderable.max_length = max(self.term.height - 9, 1)
+                max_length = max(self.term.height - 9, 1)
+            renderable = PreviewRepr(cached_obj.obj, self.term.height, max_length)
 
         else:
             if self.preview_state == PreviewState.repr:
-                renderable = cached_obj.pretty
+                renderable = PreviewRepr(cached_obj.obj, self.term.height)
                 title = "[i]preview[/i] | [i][cyan]repr[/cyan]()[/i] [dim]source"
 
             if self.preview_state == PreviewState.source:
@@ -104,13 +180,15 @@ class Overview:
         )
 
     def get_info_layout(self, cached_obj: CachedObject):
-        if cached_obj.length is not None:
+        if cached_obj.length is not None or cached_obj.length_unknown:
             layout = Layout(size=3)
             layout.split_row(
                 Layout(self.get_type_panel(cached_obj)),
                 Layout(
                     Panel(
-                        str(cached_obj.length),
+                        str(cached_obj.length)
+                        if cached_obj.length is not None
+                        else "[dim]unknown ([u]L[/u]:compute)",
                         title="[i][cyan]len[/cyan]()[/i]",
                         title_align="left",
                         style="white",
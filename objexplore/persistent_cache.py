@@ -0,0 +1,219 @@
+import hashlib
+import importlib.metadata
+import marshal
+import mmap
+import os
+import sys
+import threading
+from types import FunctionType, ModuleType
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TypeVar
+
+from . import config
+
+T = TypeVar("T")
+
+# Bump whenever what is stored changes, so old cache files are thrown away
+FORMAT_VERSION = 1
+
+# Set to 1 or 0 to turn the persistent cache on or off without changing `config.py`
+ENVIRONMENT_VARIABLE = "OBJEXPLORE_PERSISTENT_CACHE"
+
+
+def user_cache_dir() -> str:
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "objexplore")
+
+
+package_versions: Dict[str, Optional[str]] = {}
+
+
+def package_version(module_name: str) -> Optional[str]:
+    """ The installed version of the top level package of a module, if it can be found """
+    package = module_name.partition(".")[0]
+    if package not in package_versions:
+        try:
+            version: Optional[str] = importlib.metadata.version(package)
+        except Exception:
+            version = getattr(sys.modules.get(package), "__version__", None)
+            if not isinstance(version, str):
+                version = None
+        package_versions[package] = version
+    return package_versions[package]
+
+
+def locate(obj: Any) -> Optional[Tuple[str, str, str]]:
+    """Return the (file path, module name, qualified name) that identify a module, class or function
+    across sessions. Returns None for anything else, including functions and classes defined inside
+    other functions, which can't be told apart by their name"""
+    try:
+        if isinstance(obj, ModuleType):
+            module: Any = obj
+            qualname = ""
+        elif isinstance(obj, (type, FunctionType)):
+            module = sys.modules.get(obj.__module__)
+            qualname = obj.__qualname__
+            if "<locals>" in qualname or "<lambda>" in qualname:
+                return None
+        else:
+            return None
+        path = module.__file__
+        name = module.__name__
+    except Exception:
+        return None
+    if not isinstance(path, str) or not isinstance(name, str):
+        return None
+    return path, name, qualname
+
+
+class PersistentCache:
+    """Introspection results stored on disk so they don't have to be worked out again in the next
+    session. There is one file per source file, holding a flat dict of named values written with
+    `marshal` and read back through `mmap`. A file is thrown away as soon as the path, modification
+    time or size of its source file, the Python version or `FORMAT_VERSION` changes. The version of
+    the package is part of the stamp of every value about its objects"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # The values for each source file that was looked at, and the files that have new values
+        self.records: Dict[str, Dict[str, Tuple[Any, Any]]] = {}
+        self.keys: Dict[str, Tuple] = {}
+        self.dirty: Set[str] = set()
+        self.lock = threading.Lock()
+
+    def cache_path(self, path: str) -> str:
+        digest = hashlib.sha1(path.encode("utf-8", "surrogatepass")).hexdigest()
+        return os.path.join(self.directory, digest + ".marshal")
+
+    def load(self, path: str) -> Optional[Dict[str, Tuple[Any, Any]]]:
+        """ The stored values for a source file, or None if the source file can't be found """
+        record = self.records.get(path)
+        if record is not None:
+            return record
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (FORMAT_VERSION, tuple(sys.version_info), path, stat.st_mtime_ns, stat.st_size)
+
+        record = {}
+        try:
+            with open(self.cache_path(path), "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    stored_key, stored_record = marshal.loads(data)  # type: ignore
+            if stored_key == key:
+                record = stored_record
+        except Exception:
+            # Missing, empty or corrupt, start over
+            pass
+
+        with self.lock:
+            self.keys[path] = key
+            return self.records.setdefault(path, record)
+
+    def get(self, path: str, name: str, compute: Callable[[], T], stamp: Any = None) -> T:
+        """Return the value called `name` stored for a source file, or compute and store it. The value
+        must be something `marshal` can write"""
+        record = self.load(path)
+        if record is None:
+            return compute()
+
+        stored = record.get(name)
+        if stored is not None and stored[0] == stamp:
+            return stored[1]
+
+        value = compute()
+        with self.lock:
+            record[name] = (stamp, value)
+            self.dirty.add(path)
+        return value
+
+    def get_for_object(
+        self, obj: Any, field: str, compute: Callable[[], T], stamp: Any = None
+    ) -> T:
+        location = locate(obj)
+        if location is None:
+            return compute()
+        path, module_name, qualname = location
+        return self.get(
+            path,
+            f"{field} {qualname}",
+            compute,
+            stamp=(stamp, package_version(module_name)),
+        )
+
+    def save(self):
+        """ Write the files that have new values. Failing to write is not an error, it's only a cache """
+        with self.lock:
+            dirty = [(path, self.keys[path], dict(self.records[path])) for path in self.dirty]
+            self.dirty = set()
+
+        for path, key, record in dirty:
+            cache_path = self.cache_path(path)
+            temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(temporary_path, "wb") as f:
+                    marshal.dump((key, record), f)
+                os.replace(temporary_path, cache_path)
+            except Exception:
+                try:
+                    os.remove(temporary_path)
+                except OSError:
+                    pass
+
+
+# The cache of the current session, None while it is disabled. Set up by `explore()`, see
+# `enable_persistent_cache`
+persistent_cache: Optional[PersistentCache] = None
+
+
+def enable_persistent_cache(enabled: Optional[bool] = None):
+    """Turn the persistent cache on or off for the session that is starting. Unless `enabled` is
+    given, a cache that is already set up is kept, otherwise the `ENVIRONMENT_VARIABLE` decides and
+    then `config.persistent_cache_enabled`. The settings are read on every call, so they can be
+    changed at runtime"""
+    global persistent_cache
+    if enabled is None:
+        if persistent_cache is not None:
+            return
+        setting = os.environ.get(ENVIRONMENT_VARIABLE)
+        enabled = (
+            config.persistent_cache_enabled
+            if setting is None
+            else setting.strip() not in ("", "0")
+        )
+
+    if not enabled:
+        persistent_cache = None
+    elif persistent_cache is None:
+        persistent_cache = PersistentCache(
+            config.persistent_cache_dir or user_cache_dir()
+        )
+
+
+def save_persistent_cache():
+    """ Write what the session added to the persistent cache, if it is enabled """
+    if persistent_cache is not None:
+        persistent_cache.save()
+
+
+def cached_on_disk(obj: Any, field: str, compute: Callable[[], T], stamp: Any = None) -> T:
+    """ `PersistentCache.get_for_object` if the persistent cache is enabled, otherwise just `compute()` """
+    if persistent_cache is None:
+        return compute()
+    return persistent_cache.get_for_object(obj, field, compute, stamp)
+
+
+def cached_on_disk_for_file(
+    path: str, name: str, compute: Callable[[], T], stamp: Any = None
+) -> T:
+    """ `PersistentCache.get` if the persistent cache is enabled, otherwise just `compute()` """
+    if persistent_cache is None:
+        return compute()
+    return persistent_cache.get(path, name, compute, stamp)
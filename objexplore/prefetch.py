@@ -0,0 +1,39 @@
+from concurrent.futures import Future
+import threading
+from typing import Optional
+
+from .cached_object import CachedObject
+from .worker import worker_pool
+
+
+class Prefetcher:
+    """Cache the attributes of the highlighted object in the background while the cursor rests on it,
+    so exploring it is instant. Only one object is prefetched at a time, moving on to another object
+    cancels the previous prefetch"""
+
+    def __init__(self):
+        self.cached_obj: Optional[CachedObject] = None
+        self.future: Optional[Future] = None
+        self.cancelled = threading.Event()
+
+    def prefetch(self, cached_obj: CachedObject):
+        if cached_obj is self.cached_obj:
+            return
+
+        self.cancel()
+        # Nothing to prefetch for objects that have been cached already or for the `None` placeholder
+        if cached_obj.is_cached or cached_obj.obj is None:
+            return
+
+        self.cached_obj = cached_obj
+        self.cancelled = threading.Event()
+        self.future = worker_pool.submit(cached_obj.cache, self.cancelled.is_set)
+
+    def cancel(self):
+        """Stop the current prefetch. If it has not started yet it never will, otherwise `cache()`
+        stops at the next attribute and throws away what it has done so far"""
+        if self.future is not None:
+            self.future.cancel()
+            self.cancelled.set()
+        self.cached_obj = None
+        self.future = None
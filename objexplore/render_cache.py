@@ -0,0 +1,157 @@
+from collections import OrderedDict
+from concurrent.futures import Future, wait
+import time
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.segment import Segment, SegmentLines
+
+from .config import overview_render_wait, render_cache_max_entries, render_hang_time
+from .worker import run_in_own_thread
+
+# Renders in the background get a console of their own. `Console.render_lines` holds the console's
+# lock while rendering, which would keep the frame from being drawn in the meantime
+background_console = Console()
+
+
+def render_lines(
+    build: Callable[[], RenderableType], options: ConsoleOptions
+) -> List[List[Segment]]:
+    return background_console.render_lines(build(), options, pad=True)
+
+
+class RenderCache:
+    """The rendered lines of panels that are drawn again and again without changing, e.g. the
+    overview of the selected object while the cursor moves around. Rendering is the bulk of the
+    work of drawing a frame, so a panel is only laid out again when its key or size changes
+
+    Panels that are given a placeholder are rendered on a thread of their own instead, so a huge
+    value can't hold up the frame. The placeholder is drawn until the render is done, and only the
+    latest render is kept, moving on to something else drops the one that is still going
+    """
+
+    def __init__(self, max_entries: int = render_cache_max_entries):
+        self.max_entries = max_entries
+        # (key, width, height) -> (the object the key refers to, rendered lines)
+        self.entries: "OrderedDict[Hashable, Tuple[Any, List[List[Segment]]]]" = (
+            OrderedDict()
+        )
+        # The (key, object, future) of the render running in the background, if any
+        self.pending: Optional[Tuple[Hashable, Any, Future]] = None
+        self.pending_started = 0.0
+
+    def get(
+        self,
+        key: Hashable,
+        obj: Any,
+        build: Callable[[], RenderableType],
+        placeholder: Optional[Callable[[], RenderableType]] = None,
+    ) -> "CachedRender":
+        """Return a renderable that replays the lines rendered for `key` and `obj`, rendering what
+        `build` returns the first time. `obj` is kept alive along with the lines, so the ids in the
+        key can't be reused by another object. If a `placeholder` is given, `build` is rendered in
+        the background and the placeholder is drawn until it is done"""
+        return CachedRender(self, key, obj, build, placeholder)
+
+    def store(
+        self, key: Hashable, obj: Any, lines: List[List[Segment]]
+    ) -> Tuple[Any, List[List[Segment]]]:
+        entry = self.entries[key] = (obj, lines)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return entry
+
+    def render_in_background(
+        self,
+        key: Hashable,
+        obj: Any,
+        build: Callable[[], RenderableType],
+        options: ConsoleOptions,
+    ) -> bool:
+        """Start rendering `build` on a thread of its own, unless it already is, and wait up to
+        `overview_render_wait` seconds for it. Return False if it is still going. A render that is
+        dropped can't be stopped, but it no longer holds up anything else"""
+        if self.pending is None or self.pending[0] != key or self.pending[1] is not obj:
+            self.cancel()
+            self.pending_started = time.perf_counter()
+            self.pending = (
+                key,
+                obj,
+                run_in_own_thread(render_lines, build, options, name="objexplore-render"),
+            )
+
+        self.wait(overview_render_wait)
+        return self.pending is None
+
+    def wait(self, timeout: float):
+        """ Wait up to `timeout` seconds for the background render, keeping its lines once it is done """
+        if self.pending is None:
+            return
+
+        key, obj, future = self.pending
+        if not wait([future], timeout).done:
+            return
+
+        self.pending = None
+        # If the render failed it is done again in line the next time it is drawn, where the error
+        # is raised like it would have been without the background render
+        if future.exception() is None:
+            self.store(key, obj, future.result())
+
+    @property
+    def is_hung(self) -> bool:
+        """ Whether the background render has been going for longer than `render_hang_time` """
+        return (
+            self.pending is not None
+            and time.perf_counter() - self.pending_started > render_hang_time
+        )
+
+    def cancel(self):
+        """ Drop the render running in the background, its result is thrown away once it finishes """
+        self.pending = None
+
+    def clear(self):
+        self.cancel()
+        self.entries.clear()
+
+
+class CachedRender:
+    def __init__(
+        self,
+        cache: RenderCache,
+        key: Hashable,
+        obj: Any,
+        build: Callable[[], RenderableType],
+        placeholder: Optional[Callable[[], RenderableType]],
+    ):
+        self.cache = cache
+        self.key = key
+        self.obj = obj
+        self.build = build
+        self.placeholder = placeholder
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        entries = self.cache.entries
+        key = (self.key, options.max_width, options.height)
+        entry = entries.get(key)
+        if entry is not None and entry[0] is self.obj:
+            entries.move_to_end(key)
+            yield SegmentLines(entry[1], new_lines=True)
+            return
+
+        if self.placeholder is not None and not self.cache.render_in_background(
+            key, self.obj, self.build, options
+        ):
+            yield SegmentLines(
+                console.render_lines(self.placeholder(), options, pad=True),
+                new_lines=True,
+            )
+            return
+
+        entry = entries.get(key)
+        if entry is None or entry[0] is not self.obj:
+            lines = console.render_lines(self.build(), options, pad=True)
+            entry = self.cache.store(key, self.obj, lines)
+        yield SegmentLines(entry[1], new_lines=True)
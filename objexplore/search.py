@@ -0,0 +1,67 @@
+from typing import Any, Iterator, List, Optional, Sequence
+
+# Characters after which a matching character counts as the start of a word
+WORD_BOUNDARIES = "_.- "
+
+# How many names are lowercased before checking if the filter pass has used up its time
+INDEX_CHUNK_SIZE = 1024
+
+
+def fuzzy_score(query: str, name: str) -> Optional[int]:
+    """Score how well the lowercased `name` matches the lowercased `query`, higher is better.
+    Exact matches rank first, then prefixes, then substrings and finally names that only contain
+    the characters of the query in order (e.g. "rcsv" -> "read_csv"). Returns None if `name` does
+    not match at all"""
+    if not query:
+        return 0
+    if query == name:
+        return 3000
+
+    index = name.find(query)
+    if index == 0:
+        return 2000 - len(name)
+    elif index > 0:
+        bonus = 50 if name[index - 1] in WORD_BOUNDARIES else 0
+        return 1000 + bonus - index - len(name)
+
+    score = 0
+    previous = -1
+    for char in query:
+        position = name.find(char, previous + 1)
+        if position == -1:
+            return None
+        if position == previous + 1:
+            # Consecutive characters
+            score += 15
+        if position == 0 or name[position - 1] in WORD_BOUNDARIES:
+            score += 30
+        # Penalize the characters that were skipped over
+        score -= position - previous - 1
+        previous = position
+
+    return min(score - len(name), 999)
+
+
+class SearchIndex:
+    """Lowercased names, built once for a collection of names (e.g. the keys of a dictionary) so
+    searching doesn't lowercase every name on every keystroke. The names are lowercased a chunk at
+    a time by the first filter pass that needs them, see `build_steps`"""
+
+    def __init__(self, names: Sequence[Any]):
+        self.names = names
+        # None for names that are not strings, the search does not apply to them
+        self.lowered: List[Optional[str]] = []
+
+    @property
+    def is_built(self) -> bool:
+        return len(self.lowered) == len(self.names)
+
+    def build_steps(self) -> Iterator[None]:
+        """ Lowercase the names that have not been yet, yielding every `INDEX_CHUNK_SIZE` names """
+        while not self.is_built:
+            start = len(self.lowered)
+            self.lowered.extend(
+                name.lower() if type(name) == str else None
+                for name in self.names[start : start + INDEX_CHUNK_SIZE]
+            )
+            yield
@@ -0,0 +1,131 @@
+import ast
+import inspect
+import os
+import threading
+import tokenize
+from typing import Any, Dict, List, Optional, Tuple
+
+from .persistent_cache import cached_on_disk_for_file
+
+
+class SourceIndex:
+    """The lines of one source file and where each class and function in it starts and ends.
+    The file is read and parsed once, so finding the source of every function of a module doesn't
+    scan the whole file again for each one like `inspect.getsource` does"""
+
+    def __init__(self, path: str):
+        with tokenize.open(path) as f:
+            self.lines: List[str] = f.readlines()
+
+        # Lines are numbered from 1 and spans include the decorators, like `co_firstlineno`
+        self.class_spans: Dict[str, Tuple[int, int]]
+        self.function_ends: Dict[int, int]
+        self.class_spans, self.function_ends = cached_on_disk_for_file(
+            path, "spans", self.find_spans
+        )
+
+    def find_spans(self) -> Tuple[Dict[str, Tuple[int, int]], Dict[int, int]]:
+        self.class_spans = {}
+        self.function_ends = {}
+        self.index(ast.parse("".join(self.lines)), prefix="")
+        return self.class_spans, self.function_ends
+
+    def index(self, node: ast.AST, prefix: str):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                start = min(
+                    [child.lineno] + [decorator.lineno for decorator in child.decorator_list]
+                )
+                end = self.extend_over_comments(
+                    child.end_lineno or child.lineno, child.body[0].col_offset
+                )
+                qualname = prefix + child.name
+                if isinstance(child, ast.ClassDef):
+                    # The first definition wins, same as `inspect.getsource`
+                    self.class_spans.setdefault(qualname, (start, end))
+                    self.index(child, qualname + ".")
+                else:
+                    self.function_ends.setdefault(start, end)
+                    self.index(child, qualname + ".<locals>.")
+            else:
+                # Definitions inside if/try/with blocks
+                self.index(child, prefix)
+
+    def extend_over_comments(self, end: int, body_column: int) -> int:
+        """ Comments right after a block that are indented like its body belong to it, as in `inspect.getblock` """
+        for number in range(end + 1, len(self.lines) + 1):
+            line = self.lines[number - 1]
+            stripped = line.lstrip()
+            if not stripped:
+                continue
+            if stripped.startswith("#") and len(line) - len(stripped) >= body_column:
+                end = number
+            else:
+                break
+        return end
+
+    def source(self, start: int, end: int) -> str:
+        return "".join(self.lines[start - 1 : end])
+
+
+# The index of every file looked at so far with the modification time it was built for
+source_indexes: Dict[str, Tuple[float, SourceIndex]] = {}
+source_indexes_lock = threading.Lock()
+
+
+def get_source_index(path: str) -> Optional[SourceIndex]:
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+
+    with source_indexes_lock:
+        cached = source_indexes.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    try:
+        index = SourceIndex(path)
+    except (OSError, SyntaxError, ValueError, UnicodeDecodeError):
+        return None
+
+    with source_indexes_lock:
+        source_indexes[path] = (mtime, index)
+    return index
+
+
+def find_source(obj: Any) -> Optional[str]:
+    """Return the source of a module, class, function or method from the index of its file. Returns
+    None if the object is not in the index, in which case `inspect.getsource` should be used"""
+    try:
+        obj = inspect.unwrap(obj)
+        if inspect.ismethod(obj):
+            obj = obj.__func__
+        if not (inspect.ismodule(obj) or inspect.isclass(obj) or inspect.isfunction(obj)):
+            return None
+        path = inspect.getsourcefile(obj)
+    except Exception:
+        return None
+    if path is None:
+        return None
+
+    index = get_source_index(path)
+    if index is None:
+        return None
+
+    if inspect.ismodule(obj):
+        return "".join(index.lines)
+
+    elif inspect.isclass(obj):
+        span = index.class_spans.get(obj.__qualname__)
+        if span is None:
+            return None
+        return index.source(*span)
+
+    else:
+        start = obj.__code__.co_firstlineno
+        end = index.function_ends.get(start)
+        if end is None:
+            # e.g. a lambda
+            return None
+        return index.source(start, end)
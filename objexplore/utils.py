@@ -1,8 +1,35 @@
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+# `()` is the only one of the empty containers that is a singleton, a new `[]`, `{}` or `set()` is
+# never identical to anything so there is no point in making them
+EMPTY_TUPLE: tuple = ()
+
+
 def is_empty(obj):
-    """ Check to see if the object is equal to any of the following objects """
-    return not any(obj is x for x in [None, [], (), {}, set()])
+    """ Check to see if the object is identical to `None` or `()` """
+    return obj is not None and obj is not EMPTY_TUPLE
     # try:
     #     return not any(obj is x for x in [None, [], (), {}, set()])
     # except Exception:
     #     # TODO this might not be needed anymore
     #     return True
+
+
+class lazy_property(Generic[T]):
+    """Like `property`, but the value is only computed the first time it is accessed
+    and then stored on the instance so every later access is a plain attribute lookup"""
+
+    def __init__(self, func: Callable[[Any], T]):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: Any, owner: Any = None) -> T:
+        if instance is None:
+            return self  # type: ignore
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
@@ -0,0 +1,85 @@
+from concurrent.futures import Future
+import itertools
+import queue
+import threading
+from typing import Any, Callable, List, Tuple
+
+from .config import worker_threads
+
+# Jobs with a lower priority number are run first
+HIGH_PRIORITY = 0
+LOW_PRIORITY = 1
+
+
+class WorkerPool:
+    """Small pool of background threads for work that should not block the UI
+
+    Unlike `concurrent.futures.ThreadPoolExecutor` the threads are daemon threads, so an attribute
+    that hangs in the background can't stop the interpreter from exiting. The threads are only
+    started once the first job is submitted. Queued jobs are run in order of priority
+    """
+
+    def __init__(self, num_threads: int, name: str):
+        self.num_threads = num_threads
+        self.name = name
+        self.jobs: "queue.PriorityQueue[Tuple[int, int, Future, Callable, Tuple[Any, ...]]]" = (
+            queue.PriorityQueue()
+        )
+        # Keeps jobs with the same priority in the order they were submitted
+        self.counter = itertools.count()
+        self.threads: List[threading.Thread] = []
+        self.lock = threading.Lock()
+
+    def submit(
+        self, func: Callable, *args: Any, priority: int = HIGH_PRIORITY
+    ) -> Future:
+        """ Run `func(*args)` on one of the threads. The result is handed back through the future """
+        future: Future = Future()
+        self.jobs.put((priority, next(self.counter), future, func, args))
+
+        with self.lock:
+            if len(self.threads) < self.num_threads:
+                thread = threading.Thread(
+                    target=self.run,
+                    name=f"{self.name}-{len(self.threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self.threads.append(thread)
+
+        return future
+
+    def run(self):
+        while True:
+            _, _, future, func, args = self.jobs.get()
+            # Skip jobs that were cancelled before they started
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args)
+            except BaseException as err:
+                future.set_exception(err)
+            else:
+                future.set_result(result)
+
+
+def run_in_own_thread(func: Callable, *args: Any, name: str) -> Future:
+    """Run `func(*args)` on a new daemon thread of its own. For code that could hang forever, e.g.
+    a property waiting on the network, which would otherwise hold on to a thread of `worker_pool`
+    and starve the rendering, repr and prefetching queued behind it"""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def run():
+        try:
+            result = func(*args)
+        except BaseException as err:
+            future.set_exception(err)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+worker_pool = WorkerPool(worker_threads, name="objexplore-worker")
@@ -0,0 +1,39 @@
+from collections import Counter, defaultdict
+import time
+
+from objexplore.bounded_repr import bounded_repr
+
+
+class Slow:
+    def __repr__(self):
+        time.sleep(1)
+        return "Slow()"
+
+
+def test_bounded_repr():
+    assert bounded_repr([1, "a", {"b": None}]) == repr([1, "a", {"b": None}])
+    assert len(bounded_repr(list(range(10_000_000)))) < 1000
+    assert len(bounded_repr(b"x" * 10_000_000)) < 2000
+    assert bounded_repr(10 ** 10_000).startswith("<int")
+
+    start = time.perf_counter()
+    assert bounded_repr(Slow()).startswith("<Slow object at")
+    assert time.perf_counter() - start < 0.5
+
+
+def test_bounded_repr_of_subclasses():
+    big = defaultdict(int, {i: i for i in range(1_000_000)})
+    counter = Counter(range(1_000_000))
+    items = set(range(1_000_000))
+    start = time.perf_counter()
+    assert bounded_repr(big).startswith("defaultdict({0: 0, 1: 1")
+    assert len(bounded_repr(counter)) < 1000
+    assert len(bounded_repr(items)) < 1000
+    assert time.perf_counter() - start < 0.1
+
+    # Slow reprs don't hold on to the shared worker threads
+    from objexplore.worker import worker_pool
+
+    for _ in range(3):
+        bounded_repr(Slow())
+    assert worker_pool.submit(lambda: 1).result(timeout=0.5) == 1
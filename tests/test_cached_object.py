@@ -0,0 +1,310 @@
+from objexplore.cached_object import FILTER_CHUNK_SIZE, CachedObject, TypeFlag
+
+
+class Expensive:
+    def __init__(self):
+        self.repr_calls = 0
+
+    def __repr__(self):
+        self.repr_calls += 1
+        return "Expensive()"
+
+
+def test_fields_are_lazy():
+    obj = Expensive()
+    cached_obj = CachedObject(obj, attr_name="obj")
+    assert obj.repr_calls == 0
+    assert "plain_attrs" not in cached_obj.__dict__
+
+    assert cached_obj.repr.plain == "Expensive()"
+    assert cached_obj.repr.plain == "Expensive()"
+    assert obj.repr_calls == 1
+
+
+def test_cache_children():
+    cached_obj = CachedObject(Expensive(), attr_name="obj")
+    cached_obj.cache()
+    row = cached_obj.public_attributes["repr_calls"]
+    assert row.obj == 0
+    # The full CachedObject is only built when it is asked for
+    assert row._cached_object is None
+    assert row.cached_object.dotpath.plain == "obj.repr_calls"
+    assert row.cached_object is row.cached_object
+
+
+def test_dict_view():
+    cached_obj = CachedObject({"apple": 1, "banana": "b", 3: [1]}, attr_name="d")
+    cached_obj.cache()
+    view = cached_obj.filtered_dict
+    assert len(view) == 3
+    assert view._cached_objects == {}
+
+    cached_obj.set_filters(0, "APP")
+    # Non-string keys are never removed by the search
+    assert len(view) == 2
+    assert view.line(0).plain == ' "apple": <class \'int\'>'
+    assert view.cached_object(1).obj == [1]
+    assert view.cached_object(1).dotpath.plain == "d[3]"
+
+    cached_obj.set_filters(TypeFlag.STR)
+    assert len(view) == 1
+    assert view.cached_object(0).obj == "b"
+
+
+def test_incremental_search():
+    cached_obj = CachedObject({"abc": 1, "abd": 2, "xyz": 3}, attr_name="d")
+    cached_obj.cache()
+
+    cached_obj.set_filters(0, "a")
+    cached_obj.set_filters(0, "ab")
+    cached_obj.set_filters(0, "abc")
+    assert [entry.search_filter for entry in cached_obj.search_stack] == ["", "a", "ab", "abc"]
+    assert cached_obj.filtered_public_keys == []
+    assert len(cached_obj.filtered_dict) == 1
+
+    # Backspace restores the previous results from the stack
+    cached_obj.set_filters(0, "ab")
+    assert [entry.search_filter for entry in cached_obj.search_stack] == ["", "a", "ab"]
+    assert len(cached_obj.filtered_dict) == 2
+
+    cached_obj.set_filters(0, "")
+    assert len(cached_obj.filtered_dict) == 3
+    assert "keys" in cached_obj.filtered_public_keys
+
+
+def test_filter_pass_runs_in_steps(monkeypatch):
+    import objexplore.cached_object
+
+    # Only run the first chunk of each filter pass when it is started
+    monkeypatch.setattr(objexplore.cached_object, "background_time_slice", 0)
+    cached_obj = CachedObject({str(i): i for i in range(5000)}, attr_name="d")
+    cached_obj.cache()
+
+    cached_obj.set_filters(0, "1")
+    assert cached_obj.pending_filter is not None
+    assert len(cached_obj.filtered_dict) < 5000
+
+    # A new search replaces the stale pass
+    cached_obj.set_filters(0, "12")
+    while not cached_obj.run_pending_filter(0):
+        pass
+    assert len(cached_obj.filtered_dict) == len([i for i in range(5000) if "12" in str(i)])
+
+    # Filtering by type classifies the values a chunk at a time too
+    view = cached_obj.filtered_dict
+    steps = view.filter_steps(TypeFlag.INT, "")
+    next(steps)
+    assert len(view.flags) == FILTER_CHUNK_SIZE
+    for _ in steps:
+        pass
+    assert len(view.flags) == len(view) == 5000
+
+
+def test_classify():
+    from objexplore.cached_object import classify
+
+    assert classify(1) == TypeFlag.INT
+    assert classify(len) == TypeFlag.BUILTIN
+    assert classify(Expensive) == TypeFlag.CLASS
+    assert classify(Expensive().__repr__) == TypeFlag.METHOD
+
+    cached_obj = CachedObject([1, "a", 2.0, "b"], attr_name="l")
+    cached_obj.cache()
+    cached_obj.set_filters(TypeFlag.STR | TypeFlag.FLOAT)
+    filtered_list = cached_obj.filtered_list
+    assert [filtered_list.line(i).plain for i in range(len(filtered_list))] == [
+        " [1] <class 'str'>",
+        " [2] <class 'float'>",
+        " [3] <class 'str'>",
+    ]
+    assert filtered_list.cached_object(1).obj == 2.0
+
+
+def test_prefetch():
+    from objexplore.prefetch import Prefetcher
+
+    cached_obj = CachedObject(Expensive(), attr_name="obj")
+    # A cancelled cache stores nothing
+    assert not cached_obj.cache(lambda: True)
+    assert not cached_obj.is_cached
+    assert cached_obj.public_attributes == {}
+
+    prefetcher = Prefetcher()
+    prefetcher.prefetch(cached_obj)
+    assert prefetcher.future is not None
+    assert prefetcher.future.result(timeout=5)
+    assert cached_obj.is_cached
+    assert "repr_calls" in cached_obj.public_attributes
+
+    # Already cached objects are not prefetched again
+    prefetcher.cancel()
+    prefetcher.prefetch(cached_obj)
+    assert prefetcher.future is None
+
+
+def test_submodule_placeholders(tmp_path, monkeypatch):
+    import importlib
+    import sys
+
+    from objexplore.cached_object import UnimportedModule
+
+    package = tmp_path / "placeholder_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "heavy.py").write_text("VALUE = 1\n")
+    (package / "broken.py").write_text("raise ImportError('nope')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    cached_obj = CachedObject(importlib.import_module("placeholder_pkg"), attr_name="pkg")
+    cached_obj.cache()
+    row = cached_obj.public_attributes["heavy"]
+    # Listing the submodules doesn't import them
+    assert type(row.obj) == UnimportedModule
+    assert "placeholder_pkg.heavy" not in sys.modules
+    assert row.flags == TypeFlag.MODULE
+
+    assert row.resolve().obj.VALUE == 1
+    assert not row.is_placeholder
+
+    row = cached_obj.public_attributes["broken"]
+    assert type(row.resolve().obj) == UnimportedModule
+    assert not row.is_placeholder
+    assert "failed to import" in repr(row.obj)
+
+
+def test_properties_are_evaluated_when_selected():
+    import threading
+
+    from objexplore.cached_object import UnevaluatedAttribute
+
+    release = threading.Event()
+
+    class Service:
+        def __init__(self):
+            self.plain = 1
+
+        @property
+        def fast(self):
+            return 2
+
+        @property
+        def slow(self):
+            release.wait(5)
+            return 3
+
+        @property
+        def broken(self):
+            raise ValueError("down")
+
+    cached_obj = CachedObject(Service(), attr_name="service")
+    cached_obj.cache()
+    rows = cached_obj.public_attributes
+    assert rows["plain"].obj == 1
+    # No property is run to list the attributes
+    for name in ("fast", "slow", "broken"):
+        assert type(rows[name].obj) == UnevaluatedAttribute
+
+    assert rows["fast"].resolve().obj == 2
+
+    assert type(rows["slow"].resolve().obj) == UnevaluatedAttribute
+    assert rows["slow"].is_evaluating
+    release.set()
+    rows["slow"].evaluate(5)
+    assert rows["slow"].resolve().obj == 3
+
+    assert "failed: ValueError('down')" in repr(rows["broken"].resolve().obj)
+    assert not rows["broken"].is_unevaluated
+
+
+def test_class_attributes_that_run_code():
+    from objexplore.cached_object import UnevaluatedAttribute
+
+    class classproperty:
+        def __init__(self, func):
+            self.func = func
+
+        def __get__(self, obj, owner):
+            return self.func(owner)
+
+    class Meta(type):
+        @property
+        def registry(cls):
+            raise AssertionError("read while listing")
+
+    class Model(metaclass=Meta):
+        table = "models"
+
+        @classproperty
+        def count(cls):
+            raise AssertionError("read while listing")
+
+        @property
+        def name(self):
+            return "model"
+
+        def save(self):
+            pass
+
+    cached_obj = CachedObject(Model, attr_name="Model")
+    assert cached_obj.attr_runs_code("count")
+    assert cached_obj.attr_runs_code("registry")
+    for attr in ("table", "name", "save", "__init__"):
+        assert not cached_obj.attr_runs_code(attr)
+
+    cached_obj.cache()
+    assert type(cached_obj.public_attributes["count"].obj) == UnevaluatedAttribute
+    assert type(cached_obj.public_attributes["name"].obj) == property
+
+
+def test_hung_properties_dont_block_the_worker_pool(monkeypatch):
+    import threading
+
+    from objexplore import cached_object as cached_object_module
+    from objexplore.worker import worker_pool
+
+    release = threading.Event()
+
+    class Hangs:
+        @property
+        def first(self):
+            release.wait(5)
+
+        @property
+        def second(self):
+            release.wait(5)
+
+    cached_obj = CachedObject(Hangs(), attr_name="hangs")
+    cached_obj.cache()
+    rows = cached_obj.public_attributes
+    for name in ("first", "second"):
+        rows[name].resolve()
+        assert rows[name].is_evaluating
+
+    # More hung attributes than the pool has threads, other work still runs
+    assert worker_pool.submit(lambda: "rendered").result(timeout=1) == "rendered"
+
+    assert not rows["first"].is_hung
+    monkeypatch.setattr(cached_object_module, "attribute_hang_time", 0)
+    assert rows["first"].is_hung
+    release.set()
+
+
+def test_len_is_only_called_when_cheap():
+    class LazyQuery:
+        len_calls = 0
+
+        def __len__(self):
+            LazyQuery.len_calls += 1
+            return 10
+
+    cached_obj = CachedObject(LazyQuery(), attr_name="query")
+    assert cached_obj.length is None
+    assert cached_obj.length_unknown
+    assert LazyQuery.len_calls == 0
+    assert CachedObject([1, 2], attr_name="l").length == 2
+
+    cached_obj.measure_length()
+    assert cached_obj.length == 10
+    assert not cached_obj.length_unknown
+    # It was fast, so the length of other instances is shown right away
+    assert CachedObject(LazyQuery(), attr_name="query").length == 10
@@ -0,0 +1,243 @@
+import itertools
+import random
+import threading
+
+from blessed import Terminal
+
+from objexplore.cached_object import CachedObject
+from objexplore.explorer import Explorer, ExplorerState
+
+
+def position(explorer: Explorer):
+    return {
+        name: value
+        for name, value in vars(explorer).items()
+        if name.endswith(("_index", "_window"))
+    }
+
+
+# The index and window fields moved in each state
+PANE_FIELDS = {
+    ExplorerState.public: ("public_index", "public_window"),
+    ExplorerState.private: ("private_index", "private_window"),
+    ExplorerState.dict: ("dict_index", "dict_window"),
+    ExplorerState.list: ("list_index", "list_window"),
+}
+
+
+def reference_move(explorer: Explorer, index: int, window: int, down: bool):
+    """Move the selection one line, the way the explorer did before it could move many lines at
+    once. The dict and list panels have an extra line for the opening brace"""
+    num_filtered = explorer.num_filtered_attributes
+    num_lines = explorer.num_lines
+    brace = explorer.state in (ExplorerState.dict, ExplorerState.list)
+    if down:
+        if index < num_filtered - 1:
+            index += 1
+            if index >= window + num_lines - brace:
+                window += 1
+        elif window == num_filtered - num_lines + 1:
+            window += 1
+        elif (
+            brace
+            and window == num_filtered - num_lines + 2
+            and explorer.num_hidden_attributes > 0
+        ):
+            window += 1
+    else:
+        if index > 0:
+            index -= 1
+            if index < window - brace:
+                window -= 1
+        elif brace and window == 1:
+            window -= 1
+    return index, window
+
+
+def test_page_moves_match_single_moves(monkeypatch):
+    monkeypatch.setattr(Terminal, "height", property(lambda self: 15))
+    rng = random.Random(0)
+    term = Terminal()
+
+    for size in (0, 1, 5, 9, 10, 11, 12, 40):
+        for obj in (
+            {str(i): i for i in range(size)},
+            list(range(size)),
+            type("Many", (), {f"a{i}": i for i in range(size)})(),
+        ):
+            for search in ("", "1"):
+                cached_obj = CachedObject(obj, attr_name="obj")
+                cached_obj.cache()
+                # Searching hides some of the attributes, which changes how far the window scrolls
+                cached_obj.set_filters(0, search)
+                while not cached_obj.run_pending_filter(1):
+                    pass
+
+                explorer = Explorer(cached_obj=cached_obj, term=term)
+                states = [explorer.state]
+                if explorer.state == ExplorerState.public:
+                    states.append(ExplorerState.private)
+
+                for state in states:
+                    explorer.state = state
+                    index_field, window_field = PANE_FIELDS[state]
+                    index, window = 0, 0
+                    for _ in range(30):
+                        amount = rng.choice([1, 2, 3, 10, 50])
+                        down = rng.random() < 0.5
+                        if down:
+                            explorer.move_down(amount)
+                        else:
+                            explorer.move_up(amount)
+                        for _ in range(amount):
+                            index, window = reference_move(explorer, index, window, down)
+
+                        assert getattr(explorer, index_field) == index
+                        assert getattr(explorer, window_field) == window
+
+
+def test_only_visible_rows_are_built(monkeypatch):
+    monkeypatch.setattr(Terminal, "height", property(lambda self: 15))
+    cached_obj = CachedObject(list(range(100_000)), attr_name="obj")
+    cached_obj.cache()
+
+    explorer = Explorer(cached_obj=cached_obj, term=Terminal())
+    explorer.list_panel
+    explorer.move_down(50_000)
+    explorer.list_panel
+    assert len(cached_obj.filtered_list._lines) <= 2 * explorer.num_lines
+    assert explorer.selected_object.obj == 50_000
+
+
+def test_go_to_index(monkeypatch):
+    monkeypatch.setattr(Terminal, "height", property(lambda self: 15))
+    term = Terminal()
+
+    for obj in (list(range(1000)), set(range(1000)), {str(i): i for i in range(1000)}):
+        cached_obj = CachedObject(obj, attr_name="obj")
+        cached_obj.cache()
+        explorer = Explorer(cached_obj=cached_obj, term=term)
+        single = Explorer(cached_obj=cached_obj, term=term)
+
+        assert explorer.go_to_index(500)
+        for _ in range(500):
+            single.move_down()
+        assert position(explorer) == position(single)
+        assert explorer.selected_object.obj == 500
+
+        assert explorer.go_to_index(3)
+        for _ in range(497):
+            single.move_up()
+        assert position(explorer) == position(single)
+        assert not explorer.go_to_index(1000)
+
+
+def test_huge_list_is_not_copied():
+    items = [0] * 10_000_000
+    cached_obj = CachedObject(items, attr_name="obj")
+    cached_obj.cache()
+    assert cached_obj.filtered_list.items is items
+    row = cached_obj.filtered_list.cached_object(9_999_999)
+    assert row.dotpath.plain == "obj[9999999]"
+
+
+def test_list_shrinks_while_explored(monkeypatch):
+    monkeypatch.setattr(Terminal, "height", property(lambda self: 15))
+    items = list(range(1000))
+    cached_obj = CachedObject(items, attr_name="obj")
+    cached_obj.cache()
+    explorer = Explorer(cached_obj=cached_obj, term=Terminal())
+    explorer.list_panel
+
+    del items[10:]
+    explorer.move_bottom()
+    explorer.list_panel
+    assert explorer.list_index == 9
+    assert explorer.selected_object.obj == 9
+
+    # An item that went away after the length was checked is drawn as gone
+    del items[5:]
+    assert "gone" in cached_obj.filtered_list.line(7).plain
+    assert cached_obj.filtered_list.index_of(7) is None
+
+
+def test_peek_iterators(monkeypatch):
+    monkeypatch.setattr(Terminal, "height", property(lambda self: 15))
+    term = Terminal()
+
+    # An infinite iterator is only pulled as far as the last visible row
+    counter = itertools.count()
+    explorer = Explorer(cached_obj=CachedObject(counter, attr_name="obj"), term=term)
+    explorer.switch_pane(-1)
+    assert explorer.state == ExplorerState.items
+    explorer.peek_panel
+    explorer.move_bottom()
+    explorer.move_down(25)
+    explorer.peek_panel
+    assert explorer.selected_object.obj == explorer.num_lines - 1 + 25
+    assert next(counter) == explorer.list_window + explorer.num_lines
+
+    def numbers(count):
+        total = 0
+        for number in range(count):
+            total += number
+            yield number
+        raise ValueError("done")
+
+    generator = numbers(3)
+    explorer = Explorer(cached_obj=CachedObject(generator, attr_name="gen"), term=term)
+    explorer.switch_pane(-1)
+    assert explorer.state == ExplorerState.locals
+    assert explorer.selected_object.dotpath.plain == 'gen.gi_frame.f_locals["count"]'
+    assert explorer.selected_object.obj == 3
+    explorer.switch_pane(-1)
+    explorer.peek_panel
+    assert explorer.cached_obj.peeked_items.items == [0, 1, 2]
+    assert isinstance(explorer.cached_obj.peeked_items.error, ValueError)
+    assert explorer.cached_obj.peeked_items.frame_locals is None
+
+
+def test_slow_property_is_not_explored_before_it_is_read():
+    release = threading.Event()
+
+    class Service:
+        @property
+        def slow(self):
+            release.wait(5)
+            return [1, 2, 3]
+
+    cached_obj = CachedObject(Service(), attr_name="service")
+    cached_obj.cache()
+    explorer = Explorer(cached_obj=cached_obj, term=Terminal())
+    assert explorer.selected_row.name == "slow"
+
+    # Still being read, there is only the placeholder to explore
+    assert explorer.explore_selected_object() is None
+    assert not explorer.selection_ready
+    assert explorer.cached_obj is cached_obj
+
+    release.set()
+    explorer.selected_row.evaluate(5)
+    assert explorer.selection_ready
+    assert explorer.explore_selected_object().obj == [1, 2, 3]
+    assert explorer.cached_obj.obj == [1, 2, 3]
+
+
+def test_failed_submodule_is_not_explored(tmp_path, monkeypatch):
+    import importlib
+
+    package = tmp_path / "failing_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "broken.py").write_text("raise ImportError('nope')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    cached_obj = CachedObject(importlib.import_module("failing_pkg"), attr_name="pkg")
+    cached_obj.cache()
+    explorer = Explorer(cached_obj=cached_obj, term=Terminal())
+    assert explorer.selected_row.name == "broken"
+
+    # Only the placeholder that recorded the error could be explored
+    assert not explorer.selection_ready
+    assert explorer.explore_selected_object() is None
+    assert explorer.cached_obj is cached_obj
@@ -0,0 +1,22 @@
+from blessed import Terminal
+
+from objexplore.frame_buffer import FrameBuffer
+
+
+def test_only_changed_lines_are_written(capsys):
+    term = Terminal(kind="xterm-256color", force_styling=True)
+    frame_buffer = FrameBuffer(term)
+
+    frame_buffer.draw(["first", "second", "third"])
+    assert "second" in capsys.readouterr().out
+
+    frame_buffer.draw(["first", "changed", "third"])
+    out = capsys.readouterr().out
+    assert out == term.move_yx(1, 0) + "changed"
+
+    frame_buffer.draw(["first", "changed", "third"])
+    assert capsys.readouterr().out == ""
+
+    frame_buffer.invalidate()
+    frame_buffer.draw(["first", "changed", "third"])
+    assert "first" in capsys.readouterr().out
@@ -0,0 +1,68 @@
+import gc
+
+from objexplore.cached_object import CachedObject
+from objexplore.introspection import IntrospectionCache
+
+
+class Thing:
+    """ A thing """
+
+
+def test_shared_between_wrappers():
+    obj = Thing()
+    first = CachedObject(obj, attr_name="a")
+    second = CachedObject(obj, attr_name="b")
+    assert first.plain_attrs is second.plain_attrs
+    assert first.docstring is second.docstring
+    assert first.dotpath.plain != second.dotpath.plain
+
+    # Adding an attribute invalidates the cached attributes
+    obj.new_attr = 1
+    assert "new_attr" in CachedObject(obj, attr_name="c").plain_attrs
+
+
+def test_weakref_and_eviction():
+    cache = IntrospectionCache(max_entries=2, max_bytes=10_000)
+    obj = Thing()
+    introspection = cache.lookup(obj)
+    assert cache.lookup(obj) is introspection
+
+    del obj
+    gc.collect()
+    assert len(cache) == 0
+
+    things = [Thing() for _ in range(3)]
+    for thing in things:
+        cache.lookup(thing)
+    assert len(cache) == 2
+    # The least recently used entry was evicted
+    assert id(things[0]) not in cache.entries
+
+    cache.lookup(things[1]).get("big", lambda: "x" * 20_000)
+    assert list(cache.entries) == [id(things[1])]
+    assert cache.nbytes <= 20_000 + 1000
+
+    # Objects without weakref support are kept alive by their entry
+    introspection = cache.lookup([1, 2])
+    assert introspection.ref() == [1, 2]
+
+
+def test_shared_by_instances_of_a_type():
+    from objexplore.introspection import get_type_facts, list_attrs
+
+    first, second = Thing(), Thing()
+    second.own_attr = 1
+    assert CachedObject(first, attr_name="a").docstring is CachedObject(
+        second, attr_name="b"
+    ).docstring
+    assert CachedObject(first, attr_name="a").plain_attrs == list_attrs(first)
+    assert CachedObject(second, attr_name="b").plain_attrs == list_attrs(second)
+    assert CachedObject(first, attr_name="a")._source == ""
+
+    class Dynamic:
+        def __getattr__(self, name):
+            return name
+
+    assert get_type_facts(Thing).plain_instances
+    assert not get_type_facts(Dynamic).plain_instances
+    assert not get_type_facts(type).plain_instances
@@ -0,0 +1,74 @@
+import importlib
+import os
+
+from objexplore.introspection import list_attrs
+from objexplore.persistent_cache import PersistentCache, locate
+
+
+def test_persistent_cache(tmp_path, monkeypatch):
+    source = tmp_path / "src" / "cached_module.py"
+    source.parent.mkdir()
+    source.write_text("class Thing:\n    x = 1\n")
+    monkeypatch.syspath_prepend(str(source.parent))
+    module = importlib.import_module("cached_module")
+    assert locate(module.Thing) == (str(source), "cached_module", "Thing")
+    assert locate(lambda: None) is None
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return list_attrs(module.Thing)
+
+    cache = PersistentCache(str(tmp_path / "cache"))
+    attrs = cache.get_for_object(module.Thing, "attrs", compute)
+    assert cache.get_for_object(module.Thing, "attrs", compute) == attrs
+    assert len(calls) == 1
+    cache.save()
+
+    # The next session reads it back from disk
+    cache = PersistentCache(str(tmp_path / "cache"))
+    assert cache.get_for_object(module.Thing, "attrs", compute) == attrs
+    assert len(calls) == 1
+    # A different stamp means the stored value is out of date
+    cache.get_for_object(module.Thing, "attrs", compute, stamp=5)
+    assert len(calls) == 2
+
+    # Changing the source file throws everything away
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache = PersistentCache(str(tmp_path / "cache"))
+    cache.get_for_object(module.Thing, "attrs", compute)
+    assert len(calls) == 3
+
+
+def test_persistent_cache_is_set_up_at_runtime(tmp_path, monkeypatch):
+    from objexplore import config
+    from objexplore import persistent_cache as persistent_cache_module
+    from objexplore.persistent_cache import (
+        ENVIRONMENT_VARIABLE,
+        cached_on_disk,
+        enable_persistent_cache,
+        save_persistent_cache,
+    )
+
+    monkeypatch.setattr(persistent_cache_module, "persistent_cache", None)
+    monkeypatch.setattr(config, "persistent_cache_dir", str(tmp_path / "cache"))
+    monkeypatch.delenv(ENVIRONMENT_VARIABLE, raising=False)
+
+    enable_persistent_cache()
+    assert persistent_cache_module.persistent_cache is None
+
+    monkeypatch.setenv(ENVIRONMENT_VARIABLE, "1")
+    enable_persistent_cache()
+    cache = persistent_cache_module.persistent_cache
+    assert cache is not None and cache.directory == str(tmp_path / "cache")
+
+    # What is computed is written out when the session ends
+    assert cached_on_disk(os, "attrs", lambda: ["sep"]) == ["sep"]
+    save_persistent_cache()
+    assert os.listdir(tmp_path / "cache")
+
+    # An explicit argument wins over the environment
+    enable_persistent_cache(False)
+    assert persistent_cache_module.persistent_cache is None
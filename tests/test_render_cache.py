@@ -0,0 +1,88 @@
+import threading
+
+from rich.console import Console
+from rich.panel import Panel
+
+from objexplore.render_cache import RenderCache
+
+
+def test_render_cache():
+    console = Console(width=30, force_terminal=True)
+    cache = RenderCache(max_entries=2)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return Panel("hello")
+
+    obj = object()
+    expected = console.render_lines(Panel("hello"), pad=True)
+    assert console.render_lines(cache.get("key", obj, build), pad=True) == expected
+    assert console.render_lines(cache.get("key", obj, build), pad=True) == expected
+    assert len(builds) == 1
+
+    # A different size or a different object with the same key is rendered again
+    console.render_lines(cache.get("key", obj, build), console.options.update_width(20))
+    console.render_lines(cache.get("key", object(), build), pad=True)
+    assert len(builds) == 3
+    assert len(cache.entries) == 2
+
+
+def test_background_render(monkeypatch):
+    console = Console(width=30, force_terminal=True)
+    cache = RenderCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def build():
+        started.set()
+        release.wait(5)
+        return Panel("slow")
+
+    def placeholder():
+        return Panel("placeholder")
+
+    obj = object()
+    lines = console.render_lines(cache.get("key", obj, build, placeholder), pad=True)
+    assert lines == console.render_lines(placeholder(), pad=True)
+    assert cache.pending and not cache.is_hung
+
+    # A render that takes too long stops keeping the explorer busy
+    monkeypatch.setattr("objexplore.render_cache.render_hang_time", 0)
+    assert cache.is_hung
+
+    # Moving on to something else drops the render that is still going
+    assert started.wait(5)
+    console.render_lines(cache.get("other", obj, lambda: Panel("fast"), placeholder))
+    release.set()
+    while cache.pending:
+        cache.wait(0.1)
+    assert [key for key, _, _ in cache.entries] == ["other"]
+
+
+def test_preview_is_bounded():
+    from objexplore.overview import PreviewRepr
+
+    class Huge:
+        def __repr__(self):
+            return "x" * 20_000_000
+
+    console = Console(width=40, height=10, force_terminal=True)
+    for obj in (b"\0" * 20_000_000, "y" * 20_000_000, Huge(), list(range(1_000_000))):
+        lines = console.render_lines(PreviewRepr(obj, max_lines=10, max_length=50))
+        assert len(lines) <= 10
+
+
+def test_failed_placeholder_is_rendered_again():
+    from blessed import Terminal
+
+    from objexplore.cached_object import CachedObject, UnimportedModule
+    from objexplore.overview import Overview
+
+    overview = Overview(term=Terminal(), version="")
+    placeholder = UnimportedModule("package.broken", ispkg=False)
+    key = overview.render_key(CachedObject(placeholder, attr_name="broken"))
+
+    # Failing to import changes the repr of the same placeholder object
+    placeholder.error = ImportError("broken")
+    assert overview.render_key(CachedObject(placeholder, attr_name="broken")) != key
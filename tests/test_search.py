@@ -0,0 +1,107 @@
+from objexplore.cached_object import CachedObject
+from objexplore.search import SearchIndex, fuzzy_score
+
+
+def test_fuzzy_score_ranking():
+    assert fuzzy_score("read_csv", "read_csv") > fuzzy_score("read_csv", "read_csv_chunks")
+    assert fuzzy_score("read", "read_csv") > fuzzy_score("read", "spread")
+    assert fuzzy_score("csv", "read_csv") > fuzzy_score("rcsv", "read_csv")
+    assert fuzzy_score("rcsv", "read_csv") > fuzzy_score("rcsv", "reduce_cs_values")
+    assert fuzzy_score("xyz", "read_csv") is None
+
+
+def test_search_index_is_built_in_chunks():
+    from objexplore.search import INDEX_CHUNK_SIZE
+
+    index = SearchIndex(["read_csv", "to_csv", "READ_JSON", 1] * INDEX_CHUNK_SIZE)
+    steps = index.build_steps()
+    next(steps)
+    assert len(index.lowered) == INDEX_CHUNK_SIZE
+    for _ in steps:
+        pass
+    assert index.is_built
+    assert index.lowered[:4] == ["read_csv", "to_csv", "read_json", None]
+
+    # A search of a large dict is spread out over several filter steps
+    cached_obj = CachedObject({f"Key_{i}": i for i in range(50_000)}, attr_name="obj")
+    cached_obj.cache()
+    cached_obj.set_filters(0, "KEY_4999")
+    while not cached_obj.run_pending_filter(0.001):
+        pass
+    assert cached_obj.filtered_dict.search_index.is_built
+    assert [
+        cached_obj.filtered_dict.keys[position]
+        for position in cached_obj.filtered_dict.positions
+    ] == ["Key_4999"] + [f"Key_4999{i}" for i in range(10)]
+
+
+def test_fuzzy_search_sorts_matches():
+    class Module:
+        def read_csv(self):
+            pass
+
+        def read_clipboard(self):
+            pass
+
+        def to_csv(self):
+            pass
+
+    cached_obj = CachedObject(Module(), attr_name="pd")
+    cached_obj.cache()
+    cached_obj.set_filters(0, "rcsv", fuzzy_search=True)
+    assert cached_obj.filtered_public_keys == ["read_csv"]
+
+    cached_obj.set_filters(0, "csv", fuzzy_search=True)
+    assert cached_obj.filtered_public_keys == ["to_csv", "read_csv"]
+
+
+def test_deep_search():
+    from blessed import Terminal
+
+    from objexplore.deep_search import DeepSearch
+
+    class Node:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+    root = Node(config={"db": Node(host="localhost", port=5432)}, items=[Node(host="remote")])
+    root.me = root
+
+    deep_search = DeepSearch(term=Terminal())
+    deep_search.query = "host"
+    deep_search.start(CachedObject(root, attr_name="root"))
+    while not deep_search.run_pending_search(1):
+        pass
+
+    # Breadth first, and `root.me` is not searched again
+    assert [result.path for result in deep_search.results] == [
+        'root.config["db"].host',
+        "root.items[0].host",
+    ]
+
+
+def test_deep_search_steps_are_bounded():
+    import time
+
+    from blessed import Terminal
+
+    from objexplore.deep_search import DeepSearch
+
+    root = {"big": list(range(3_000_000)), "huge": 10 ** 10_000, "last": "needle"}
+    deep_search = DeepSearch(term=Terminal())
+    deep_search.query = "needle"
+    deep_search.start(CachedObject(root, attr_name="root"))
+
+    slowest = 0.0
+    while True:
+        start = time.perf_counter()
+        done = deep_search.run_pending_search(0.01)
+        slowest = max(slowest, time.perf_counter() - start)
+        if done:
+            break
+
+    # The huge int doesn't stop the search of its siblings, and the children of the list count
+    # against the node budget
+    assert [result.path for result in deep_search.results] == ['root["last"]']
+    assert deep_search.num_visited < 300_000
+    assert slowest < 0.1
@@ -0,0 +1,53 @@
+import importlib
+import inspect
+import os
+
+from objexplore.source_index import find_source, get_source_index
+
+MODULE_SOURCE = '''import functools
+
+
+class Outer:
+    class Inner:
+        pass
+
+    @functools.lru_cache()
+    def method(self):
+        return 1
+        # trailing comment
+
+
+def function():
+    def nested():
+        pass
+
+    return nested
+'''
+
+
+def test_find_source(tmp_path, monkeypatch):
+    path = tmp_path / "indexed_module.py"
+    path.write_text(MODULE_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("indexed_module")
+
+    for obj in [
+        module,
+        module.Outer,
+        module.Outer.Inner,
+        module.Outer.method,
+        module.Outer().method,
+        module.function,
+        module.function(),
+    ]:
+        assert find_source(obj) == inspect.getsource(obj)
+
+    # The index is built again once the file changes
+    index = get_source_index(str(path))
+    assert get_source_index(str(path)) is index
+    path.write_text(MODULE_SOURCE + "\n\nx = 1\n")
+    os.utime(path, (0, 0))
+    assert get_source_index(str(path)) is not index
+
+    assert find_source(lambda: None) is None
+    assert find_source(len) is None